@@ -1,15 +1,20 @@
 """Command-line interface for OGP Helper scheduling tool."""
 
 import argparse
+import dataclasses
+import functools
+import io
 import json
+import math
 import random
 import sys
-from datetime import date, time, timedelta
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date, time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from ogphelper.domain.demand import (
-    DemandCurve,
     DemandProfile,
     WeeklyDemand,
 )
@@ -27,115 +32,89 @@ from ogphelper.domain.models import (
     SlotRangeCaps,
     WeeklyScheduleRequest,
 )
-from ogphelper.output.pdf_generator import PDFGenerator
-from ogphelper.scheduling.cpsat_solver import OptimizationMode, SolverConfig
-from ogphelper.scheduling.demand_aware_scheduler import (
-    DemandAwareConfig,
-    DemandAwareWeeklyScheduler,
-    SolverType,
-)
-from ogphelper.scheduling.scheduler import Scheduler
-from ogphelper.scheduling.weekly_scheduler import WeeklyScheduler
-from ogphelper.validation.validator import ScheduleValidator
-
-
-def create_sample_associates(
-    count: int = 10,
-    schedule_dates: Optional[list[date]] = None,
-    seed: Optional[int] = None,
-    variety_level: str = "high",
-) -> list[Associate]:
-    """Create sample associates with diverse availability patterns for testing.
-
-    Args:
-        count: Number of associates to create.
-        schedule_dates: List of dates for availability. If None, uses today only.
-        seed: Random seed for reproducibility. If None, uses current time.
-        variety_level: Level of variety - "low", "medium", or "high".
-    """
-    rng = random.Random(seed if seed is not None else 42)
-    associates = []
 
-    if schedule_dates is None:
-        schedule_dates = [date.today()]
+# Every associate starts out allowed to do every role
+_ALL_ROLES: frozenset[JobRole] = frozenset(JobRole)
 
-    # Sample names
-    names = [
-        "Alice", "Bob", "Carol", "David", "Eve", "Frank", "Grace", "Henry",
-        "Ivy", "Jack", "Kate", "Leo", "Mia", "Noah", "Olivia", "Paul",
-        "Quinn", "Rose", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier",
-        "Yara", "Zach", "Amy", "Ben", "Chloe", "Dan", "Emma", "Finn",
-        "Gina", "Hugo", "Iris", "Jake", "Kim", "Luke", "Maya", "Nate",
-    ]
+# Sample names
+_SAMPLE_NAMES: tuple[str, ...] = (
+    "Alice", "Bob", "Carol", "David", "Eve", "Frank", "Grace", "Henry",
+    "Ivy", "Jack", "Kate", "Leo", "Mia", "Noah", "Olivia", "Paul",
+    "Quinn", "Rose", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier",
+    "Yara", "Zach", "Amy", "Ben", "Chloe", "Dan", "Emma", "Finn",
+    "Gina", "Hugo", "Iris", "Jake", "Kim", "Luke", "Maya", "Nate",
+)
 
-    # Define diverse shift patterns (start_slot, end_slot, name)
-    # Slots: 0=5AM, 4=6AM, 12=8AM, 20=10AM, 28=12PM, 36=2PM, 44=4PM, 52=6PM, 60=8PM, 68=10PM
-    shift_patterns = [
-        (0, 32, "early_short"),      # 5 AM - 1 PM (8 hrs)
-        (0, 40, "early_long"),       # 5 AM - 3 PM (10 hrs)
-        (4, 36, "morning"),          # 6 AM - 2 PM (8 hrs)
-        (8, 40, "morning_flex"),     # 7 AM - 3 PM (8 hrs)
-        (12, 44, "day_early"),       # 8 AM - 4 PM (8 hrs)
-        (16, 48, "day_mid"),         # 9 AM - 5 PM (8 hrs)
-        (20, 52, "day_late"),        # 10 AM - 6 PM (8 hrs)
-        (24, 56, "swing_early"),     # 11 AM - 7 PM (8 hrs)
-        (28, 60, "swing_mid"),       # 12 PM - 8 PM (8 hrs)
-        (32, 64, "swing_late"),      # 1 PM - 9 PM (8 hrs)
-        (36, 68, "closing_early"),   # 2 PM - 10 PM (8 hrs)
-        (40, 68, "closing_mid"),     # 3 PM - 10 PM (7 hrs)
-        (44, 68, "closing_late"),    # 4 PM - 10 PM (6 hrs)
-        (0, 68, "full_day"),         # 5 AM - 10 PM (full availability)
-        (12, 52, "school_hours"),    # 8 AM - 6 PM (school schedule)
-        (0, 24, "early_only"),       # 5 AM - 11 AM (opener)
-        (48, 68, "evening_only"),    # 5 PM - 10 PM (closer)
-    ]
+# Define diverse shift patterns (start_slot, end_slot, name)
+# Slots: 0=5AM, 4=6AM, 12=8AM, 20=10AM, 28=12PM, 36=2PM, 44=4PM, 52=6PM, 60=8PM, 68=10PM
+_SHIFT_PATTERNS: tuple[tuple[int, int, str], ...] = (
+    (0, 32, "early_short"),      # 5 AM - 1 PM (8 hrs)
+    (0, 40, "early_long"),       # 5 AM - 3 PM (10 hrs)
+    (4, 36, "morning"),          # 6 AM - 2 PM (8 hrs)
+    (8, 40, "morning_flex"),     # 7 AM - 3 PM (8 hrs)
+    (12, 44, "day_early"),       # 8 AM - 4 PM (8 hrs)
+    (16, 48, "day_mid"),         # 9 AM - 5 PM (8 hrs)
+    (20, 52, "day_late"),        # 10 AM - 6 PM (8 hrs)
+    (24, 56, "swing_early"),     # 11 AM - 7 PM (8 hrs)
+    (28, 60, "swing_mid"),       # 12 PM - 8 PM (8 hrs)
+    (32, 64, "swing_late"),      # 1 PM - 9 PM (8 hrs)
+    (36, 68, "closing_early"),   # 2 PM - 10 PM (8 hrs)
+    (40, 68, "closing_mid"),     # 3 PM - 10 PM (7 hrs)
+    (44, 68, "closing_late"),    # 4 PM - 10 PM (6 hrs)
+    (0, 68, "full_day"),         # 5 AM - 10 PM (full availability)
+    (12, 52, "school_hours"),    # 8 AM - 6 PM (school schedule)
+    (0, 24, "early_only"),       # 5 AM - 11 AM (opener)
+    (48, 68, "evening_only"),    # 5 PM - 10 PM (closer)
+)
 
-    # Days off patterns: (preferred_days_off, pattern_name)
-    # Days: 0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun
-    days_off_patterns = [
-        ([5, 6], "weekend_off"),          # Sat-Sun off
-        ([0, 1], "early_week_off"),        # Mon-Tue off
-        ([1, 2], "tue_wed_off"),           # Tue-Wed off
-        ([2, 3], "wed_thu_off"),           # Wed-Thu off
-        ([3, 4], "thu_fri_off"),           # Thu-Fri off
-        ([4, 5], "fri_sat_off"),           # Fri-Sat off
-        ([6, 0], "sun_mon_off"),           # Sun-Mon off
-        ([0, 3], "split_mon_thu"),         # Mon, Thu off
-        ([2, 5], "split_wed_sat"),         # Wed, Sat off
-        ([1, 4], "split_tue_fri"),         # Tue, Fri off
-        ([0, 4], "bookend_mon_fri"),       # Mon, Fri off
-        ([2, 6], "mid_late_week"),         # Wed, Sun off
-        ([5,], "sat_only"),                # Sat off (works 6 days)
-        ([6,], "sun_only"),                # Sun off (works 6 days)
-        ([4,], "fri_only"),                # Fri off (works 6 days)
-        ([], "no_fixed_off"),              # No fixed pattern (full availability)
-    ]
+# Days off patterns: (preferred_days_off, pattern_name)
+# Days: 0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun
+_DAYS_OFF_PATTERNS: tuple[tuple[frozenset[int], str], ...] = (
+    (frozenset({5, 6}), "weekend_off"),      # Sat-Sun off
+    (frozenset({0, 1}), "early_week_off"),   # Mon-Tue off
+    (frozenset({1, 2}), "tue_wed_off"),      # Tue-Wed off
+    (frozenset({2, 3}), "wed_thu_off"),      # Wed-Thu off
+    (frozenset({3, 4}), "thu_fri_off"),      # Thu-Fri off
+    (frozenset({4, 5}), "fri_sat_off"),      # Fri-Sat off
+    (frozenset({6, 0}), "sun_mon_off"),      # Sun-Mon off
+    (frozenset({0, 3}), "split_mon_thu"),    # Mon, Thu off
+    (frozenset({2, 5}), "split_wed_sat"),    # Wed, Sat off
+    (frozenset({1, 4}), "split_tue_fri"),    # Tue, Fri off
+    (frozenset({0, 4}), "bookend_mon_fri"),  # Mon, Fri off
+    (frozenset({2, 6}), "mid_late_week"),    # Wed, Sun off
+    (frozenset({5}), "sat_only"),            # Sat off (works 6 days)
+    (frozenset({6}), "sun_only"),            # Sun off (works 6 days)
+    (frozenset({4}), "fri_only"),            # Fri off (works 6 days)
+    (frozenset(), "no_fixed_off"),           # No fixed pattern (full availability)
+)
 
-    # Weekly hour targets: (max_daily, max_weekly, type_name)
-    hour_targets = [
-        (480, 2400, "full_time"),      # 8 hrs/day, 40 hrs/week
-        (480, 2000, "full_time_cap"),  # 8 hrs/day, 33 hrs/week
-        (360, 1800, "three_quarter"),  # 6 hrs/day, 30 hrs/week
-        (480, 1600, "part_time_a"),    # 8 hrs/day, 26 hrs/week
-        (360, 1200, "part_time_b"),    # 6 hrs/day, 20 hrs/week
-        (480, 2400, "flex_full"),      # Standard full time
-        (420, 2100, "moderate"),       # 7 hrs/day, 35 hrs/week
-    ]
+# Weekly hour targets: (max_daily, max_weekly, type_name)
+_HOUR_TARGETS: tuple[tuple[int, int, str], ...] = (
+    (480, 2400, "full_time"),      # 8 hrs/day, 40 hrs/week
+    (480, 2000, "full_time_cap"),  # 8 hrs/day, 33 hrs/week
+    (360, 1800, "three_quarter"),  # 6 hrs/day, 30 hrs/week
+    (480, 1600, "part_time_a"),    # 8 hrs/day, 26 hrs/week
+    (360, 1200, "part_time_b"),    # 6 hrs/day, 20 hrs/week
+    (480, 2400, "flex_full"),      # Standard full time
+    (420, 2100, "moderate"),       # 7 hrs/day, 35 hrs/week
+)
 
-    # Role restrictions combinations
-    role_restrictions = [
-        (set(), "no_restrictions"),                           # Can do all
-        ({JobRole.BACKROOM}, "no_backroom"),                  # No backroom
-        ({JobRole.GMD_SM}, "no_gmd"),                         # No GMD
-        ({JobRole.EXCEPTION_SM}, "no_exception"),             # No exception
-        ({JobRole.STAGING}, "no_staging"),                    # No staging
-        ({JobRole.BACKROOM, JobRole.GMD_SM}, "no_back_gmd"), # No backroom or GMD
-        ({JobRole.STAGING, JobRole.BACKROOM}, "no_stg_back"),# No staging or backroom
-        ({JobRole.GMD_SM, JobRole.EXCEPTION_SM}, "no_sm"),   # No supervisor roles
-    ]
+# Role restrictions combinations
+_ROLE_RESTRICTIONS: tuple[tuple[frozenset[JobRole], str], ...] = (
+    (frozenset(), "no_restrictions"),                                # Can do all
+    (frozenset({JobRole.BACKROOM}), "no_backroom"),                  # No backroom
+    (frozenset({JobRole.GMD_SM}), "no_gmd"),                         # No GMD
+    (frozenset({JobRole.EXCEPTION_SM}), "no_exception"),             # No exception
+    (frozenset({JobRole.STAGING}), "no_staging"),                    # No staging
+    (frozenset({JobRole.BACKROOM, JobRole.GMD_SM}), "no_back_gmd"),  # No backroom or GMD
+    (frozenset({JobRole.STAGING, JobRole.BACKROOM}), "no_stg_back"), # No staging or backroom
+    (frozenset({JobRole.GMD_SM, JobRole.EXCEPTION_SM}), "no_sm"),    # No supervisor roles
+)
 
-    # Role preference combinations
-    preference_combos = [
+# Role preference combinations
+_PREFERENCE_COMBOS: tuple[tuple[Mapping[JobRole, Preference], str], ...] = tuple(
+    (MappingProxyType(prefs), combo_name)
+    for prefs, combo_name in (
         ({}, "neutral"),                                      # No preferences
         ({JobRole.PICKING: Preference.PREFER}, "prefer_picking"),
         ({JobRole.BACKROOM: Preference.PREFER}, "prefer_backroom"),
@@ -149,33 +128,270 @@ def create_sample_associates(
         ({JobRole.STAGING: Preference.PREFER, JobRole.PICKING: Preference.AVOID}, "stg_not_pick"),
         ({JobRole.GMD_SM: Preference.AVOID, JobRole.EXCEPTION_SM: Preference.AVOID}, "avoid_sm"),
         ({JobRole.BACKROOM: Preference.PREFER, JobRole.STAGING: Preference.PREFER}, "prefer_back_stg"),
+    )
+)
+
+# Days off patterns for realistic associates - exactly 2 days off per week
+# for full-time. Patterns rotate to distribute days off across the week.
+_REALISTIC_DAYS_OFF_PATTERNS: tuple[frozenset[int], ...] = (
+    frozenset({5, 6}),  # Sat-Sun off
+    frozenset({0, 1}),  # Mon-Tue off
+    frozenset({1, 2}),  # Tue-Wed off
+    frozenset({2, 3}),  # Wed-Thu off
+    frozenset({3, 4}),  # Thu-Fri off
+    frozenset({4, 5}),  # Fri-Sat off
+    frozenset({6, 0}),  # Sun-Mon off
+    frozenset({0, 3}),  # Mon, Thu off (split)
+    frozenset({2, 5}),  # Wed, Sat off (split)
+    frozenset({1, 4}),  # Tue, Fri off (split)
+    frozenset({0, 4}),  # Mon, Fri off (split)
+    frozenset({2, 6}),  # Wed, Sun off (split)
+    frozenset({1, 5}),  # Tue, Sat off (split)
+    frozenset({3, 6}),  # Thu, Sun off (split)
+)
+
+# Role restrictions for realistic associates (most have no restrictions)
+_REALISTIC_ROLE_RESTRICTIONS: tuple[frozenset[JobRole], ...] = (
+    frozenset(),  # No restrictions (most common)
+    frozenset(),
+    frozenset(),
+    frozenset(),
+    frozenset(),
+    frozenset({JobRole.BACKROOM}),
+    frozenset({JobRole.GMD_SM}),
+    frozenset({JobRole.STAGING}),
+    frozenset({JobRole.SR}),
+)
+
+# Role preferences for realistic associates (most are neutral)
+_NO_PREFERENCES: Mapping[JobRole, Preference] = MappingProxyType({})
+_REALISTIC_PREFERENCE_COMBOS: tuple[Mapping[JobRole, Preference], ...] = (
+    _NO_PREFERENCES,  # Neutral (most common)
+    _NO_PREFERENCES,
+    _NO_PREFERENCES,
+    _NO_PREFERENCES,
+    MappingProxyType({JobRole.PICKING: Preference.PREFER}),
+    MappingProxyType({JobRole.BACKROOM: Preference.PREFER}),
+    MappingProxyType({JobRole.STAGING: Preference.PREFER}),
+    MappingProxyType({JobRole.BACKROOM: Preference.AVOID}),
+    MappingProxyType({JobRole.SR: Preference.PREFER}),
+)
+
+# The same patterns as weekday bitmasks (bit N set = weekday N is off)
+_REALISTIC_DAYS_OFF_MASKS: tuple[int, ...] = tuple(
+    sum(1 << weekday for weekday in pattern)
+    for pattern in _REALISTIC_DAYS_OFF_PATTERNS
+)
+
+# Shared availability instances - most associates repeat the same
+# (start_slot, end_slot) windows, so Availability objects are interned
+_OFF_DAY = Availability.off_day()
+_availability = functools.lru_cache(maxsize=256)(Availability)
+
+# Less variety for "medium" - use the first part of each option table
+_MEDIUM_SHIFT_PATTERNS = _SHIFT_PATTERNS[:10]
+_MEDIUM_DAYS_OFF_PATTERNS = _DAYS_OFF_PATTERNS[:8]
+_MEDIUM_HOUR_TARGETS = _HOUR_TARGETS[:4]
+_MEDIUM_ROLE_RESTRICTIONS = _ROLE_RESTRICTIONS[:4]
+_MEDIUM_PREFERENCE_COMBOS = _PREFERENCE_COMBOS[:6]
+
+# Shift time jitter for high/medium variety: -4 to +4 slots (1 hour)
+_SHIFT_JITTERS: tuple[int, ...] = (-4, -2, 0, 2, 4)
+
+# "low" variety cycles deterministically through the first few options of
+# each table; the combined cycle repeats every lcm(5, 4, 3, 2, 3) associates
+_LOW_VARIETY_TABLE = tuple(
+    (
+        _SHIFT_PATTERNS[i % 5],
+        _DAYS_OFF_PATTERNS[i % 4],
+        _HOUR_TARGETS[i % 3],
+        _ROLE_RESTRICTIONS[i % 2],
+        _PREFERENCE_COMBOS[i % 3],
+    )
+    for i in range(math.lcm(5, 4, 3, 2, 3))
+)
+
+
+# Standard realistic shift start distribution (47 associates), built once
+_STANDARD_SHIFT_STARTS: tuple[ShiftStartConfig, ...] = tuple(
+    ShiftStartConfig.create_standard_distribution()
+)
+_STANDARD_SHIFT_START_TOTAL = sum(cfg.target_count for cfg in _STANDARD_SHIFT_STARTS)
+
+
+@functools.lru_cache(maxsize=32)
+def _scaled_shift_starts(associate_count: int) -> tuple[ShiftStartConfig, ...]:
+    """Scale the standard shift start distribution to an associate count.
+
+    Results are cached per count and never handed out directly; use
+    _realistic_shift_starts for configs a caller may keep.
+
+    Args:
+        associate_count: Total number of associates to distribute.
+
+    Returns:
+        Shift start configs whose target counts sum to associate_count.
+    """
+    if associate_count == _STANDARD_SHIFT_START_TOTAL:
+        return _STANDARD_SHIFT_STARTS
+    return tuple(
+        ShiftStartConfig.scale_distribution(
+            list(_STANDARD_SHIFT_STARTS), associate_count
+        )
+    )
+
+
+def _realistic_shift_starts(associate_count: int) -> list[ShiftStartConfig]:
+    """Get the standard shift start distribution scaled to an associate count.
+
+    Args:
+        associate_count: Total number of associates to distribute.
+
+    Returns:
+        Fresh shift start configs whose target counts sum to associate_count.
+    """
+    return [
+        dataclasses.replace(cfg) for cfg in _scaled_shift_starts(associate_count)
     ]
 
-    for i in range(count):
-        name = names[i % len(names)]
-        if i >= len(names):
-            name = f"{name}{i // len(names) + 1}"
 
+# CLI --days-off-pattern choices
+_PATTERN_MAP: Mapping[str, DaysOffPattern] = MappingProxyType({
+    "none": DaysOffPattern.NONE,
+    "two_consecutive": DaysOffPattern.TWO_CONSECUTIVE,
+    "one_weekend_day": DaysOffPattern.ONE_WEEKEND_DAY,
+    "every_other_day": DaysOffPattern.EVERY_OTHER_DAY,
+})
+
+# CLI --profile choices; factories are only called for the selected profile
+_PROFILE_FACTORIES: Mapping[str, Callable[[], DemandProfile]] = MappingProxyType({
+    "weekday": DemandProfile.create_weekday_profile,
+    "weekend": DemandProfile.create_weekend_profile,
+    "high_volume": DemandProfile.create_high_volume_profile,
+})
+
+# Report day labels indexed by date.weekday(); avoids per-row strftime
+_WEEKDAY_ABBRS: tuple[str, ...] = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@functools.lru_cache(maxsize=64)
+def _scaled_profile(profile_name: str, scale_factor: float) -> DemandProfile:
+    """Get a built-in demand profile scaled for a workforce size.
+
+    Results are cached per (profile, scale), so callers must treat the
+    returned profile as read-only.
+
+    Args:
+        profile_name: Key into _PROFILE_FACTORIES.
+        scale_factor: Multiplier applied to the profile's staffing targets.
+
+    Returns:
+        The scaled DemandProfile.
+    """
+    return _PROFILE_FACTORIES[profile_name]().scaled(scale_factor)
+
+
+def _sample_names(count: int) -> list[str]:
+    """Build display names for the first ``count`` sample associates.
+
+    Names cycle through _SAMPLE_NAMES; each later pass appends its pass
+    number ("Alice2", "Alice3", ...).
+
+    Args:
+        count: Number of names to build.
+
+    Returns:
+        One name per associate index.
+    """
+    names = list(_SAMPLE_NAMES[:count])
+    for i in range(len(_SAMPLE_NAMES), count):
+        lap, pos = divmod(i, len(_SAMPLE_NAMES))
+        names.append(_SAMPLE_NAMES[pos] + str(lap + 1))
+    return names
+
+
+def create_sample_associates(
+    count: int = 10,
+    schedule_dates: Optional[list[date]] = None,
+    seed: Optional[int] = None,
+    variety_level: str = "high",
+) -> list[Associate]:
+    """Create sample associates with diverse availability patterns for testing.
+
+    Generation runs in-process from a single seeded RNG stream; it takes a
+    few milliseconds even for hundreds of associates, far less than the
+    cost of starting worker processes.
+
+    Args:
+        count: Number of associates to create.
+        schedule_dates: List of dates for availability. If None, uses today only.
+        seed: Random seed for reproducibility. If None, uses current time.
+        variety_level: Level of variety - "low", "medium", or "high".
+    """
+    if count <= 0:
+        return []
+
+    rng = random.Random(seed if seed is not None else 42)
+    associates = []
+
+    if schedule_dates is None:
+        schedule_dates = [date.today()]
+
+    # Weekdays are the same for every associate, so compute them once
+    dated_weekdays = [(d, d.weekday()) for d in schedule_dates]
+    pattern_off_flags: dict[frozenset[int], tuple[bool, ...]] = {}
+    # Read-only availability maps shared by associates with the same window
+    # and days off (low/medium variety only)
+    shared_availability: dict[
+        tuple[Availability, tuple[bool, ...]], Mapping[date, Availability]
+    ] = {}
+
+    # Draw every associate's pattern selections in one batch per table
+    if variety_level == "high":
+        selections = list(zip(
+            rng.choices(_SHIFT_PATTERNS, k=count),
+            rng.choices(_DAYS_OFF_PATTERNS, k=count),
+            rng.choices(_HOUR_TARGETS, k=count),
+            rng.choices(_ROLE_RESTRICTIONS, k=count),
+            rng.choices(_PREFERENCE_COMBOS, k=count),
+            strict=True,
+        ))
+    elif variety_level == "medium":
+        selections = list(zip(
+            rng.choices(_MEDIUM_SHIFT_PATTERNS, k=count),
+            rng.choices(_MEDIUM_DAYS_OFF_PATTERNS, k=count),
+            rng.choices(_MEDIUM_HOUR_TARGETS, k=count),
+            rng.choices(_MEDIUM_ROLE_RESTRICTIONS, k=count),
+            rng.choices(_MEDIUM_PREFERENCE_COMBOS, k=count),
+            strict=True,
+        ))
+
+    # Per-associate shift time jitter for high/medium, also drawn in batches
+    if variety_level in ("high", "medium"):
+        jitters = list(zip(
+            rng.choices(_SHIFT_JITTERS, k=count),
+            rng.choices(_SHIFT_JITTERS, k=count),
+            strict=True,
+        ))
+
+    for i, name in enumerate(_sample_names(count)):
         # Select patterns with variety based on level
-        if variety_level == "high":
-            shift_pattern = rng.choice(shift_patterns)
-            days_off_pattern = rng.choice(days_off_patterns)
-            hour_target = rng.choice(hour_targets)
-            role_restriction = rng.choice(role_restrictions)
-            preference_combo = rng.choice(preference_combos)
-        elif variety_level == "medium":
-            # Less variety - use first half of options
-            shift_pattern = rng.choice(shift_patterns[:10])
-            days_off_pattern = rng.choice(days_off_patterns[:8])
-            hour_target = rng.choice(hour_targets[:4])
-            role_restriction = rng.choice(role_restrictions[:4])
-            preference_combo = rng.choice(preference_combos[:6])
+        if variety_level in ("high", "medium"):
+            (
+                shift_pattern,
+                days_off_pattern,
+                hour_target,
+                role_restriction,
+                preference_combo,
+            ) = selections[i]
         else:  # low
-            shift_pattern = shift_patterns[i % 5]
-            days_off_pattern = days_off_patterns[i % 4]
-            hour_target = hour_targets[i % 3]
-            role_restriction = role_restrictions[i % 2]
-            preference_combo = preference_combos[i % 3]
+            (
+                shift_pattern,
+                days_off_pattern,
+                hour_target,
+                role_restriction,
+                preference_combo,
+            ) = _LOW_VARIETY_TABLE[i % len(_LOW_VARIETY_TABLE)]
 
         start_slot, end_slot, _ = shift_pattern
         preferred_days_off, _ = days_off_pattern
@@ -185,39 +401,46 @@ def create_sample_associates(
 
         # Add some per-associate variation to shift times
         if variety_level in ("high", "medium"):
-            start_jitter = rng.randint(-2, 2) * 2  # -4 to +4 slots (1 hour)
-            end_jitter = rng.randint(-2, 2) * 2
+            start_jitter, end_jitter = jitters[i]
             start_slot = max(0, min(60, start_slot + start_jitter))
             end_slot = max(start_slot + 16, min(68, end_slot + end_jitter))
 
-        # Build availability for each date
-        availability = {}
-        for d in schedule_dates:
-            weekday = d.weekday()
-
-            # Check if this day should be off based on pattern
-            is_day_off = weekday in preferred_days_off
-
-            # Add some randomization to days off for high variety
-            if variety_level == "high" and not is_day_off:
-                # 15% chance of a random day off
-                if rng.random() < 0.15:
-                    is_day_off = True
-
-            if is_day_off:
-                availability[d] = Availability.off_day()
-            else:
-                # Add some daily variation for high variety
-                if variety_level == "high" and rng.random() < 0.2:
+        availability: Mapping[date, Availability]
+        if variety_level == "high":
+            # Build availability for each date. The per-day draws stay lazy:
+            # only working days consume randomness, which measures faster
+            # than precomputing masks for every (associate, date) pair.
+            day_availability: dict[date, Availability] = {}
+            for d, weekday in dated_weekdays:
+                # Pattern days off, plus a 15% chance of a random day off
+                if weekday in preferred_days_off or rng.random() < 0.15:
+                    day_availability[d] = _OFF_DAY
+                elif rng.random() < 0.2:
                     # Vary the shift slightly for this day
                     day_start = max(0, start_slot + rng.randint(-4, 4))
                     day_end = max(day_start + 16, min(68, end_slot + rng.randint(-4, 4)))
-                    availability[d] = Availability(start_slot=day_start, end_slot=day_end)
+                    day_availability[d] = _availability(day_start, day_end)
                 else:
-                    availability[d] = Availability(start_slot=start_slot, end_slot=end_slot)
-
-        # All roles allowed by default, then apply restrictions
-        allowed_roles = set(JobRole)
+                    day_availability[d] = _availability(start_slot, end_slot)
+            availability = day_availability
+        else:
+            # Without per-day randomness a day is off exactly when its weekday
+            # is in the pattern, so associates on a pattern share their flags
+            off_flags = pattern_off_flags.get(preferred_days_off)
+            if off_flags is None:
+                off_flags = pattern_off_flags[preferred_days_off] = tuple(
+                    weekday in preferred_days_off for _, weekday in dated_weekdays
+                )
+            window = _availability(start_slot, end_slot)
+            shared = shared_availability.get((window, off_flags))
+            if shared is None:
+                shared = shared_availability[window, off_flags] = (
+                    MappingProxyType({
+                        d: _OFF_DAY if is_off else window
+                        for d, is_off in zip(schedule_dates, off_flags, strict=True)
+                    })
+                )
+            availability = shared
 
         associate = Associate(
             id=f"A{i + 1:03d}",
@@ -225,9 +448,9 @@ def create_sample_associates(
             availability=availability,
             max_minutes_per_day=max_daily,
             max_minutes_per_week=max_weekly,
-            supervisor_allowed_roles=allowed_roles,
-            cannot_do_roles=set(cannot_do),
-            role_preferences=dict(preferences),
+            supervisor_allowed_roles=_ALL_ROLES,
+            cannot_do_roles=cannot_do,
+            role_preferences=preferences,
         )
         associates.append(associate)
 
@@ -235,7 +458,7 @@ def create_sample_associates(
 
 
 def create_realistic_associates(
-    shift_start_configs: list[ShiftStartConfig],
+    shift_start_configs: Sequence[ShiftStartConfig],
     schedule_dates: list[date],
     seed: Optional[int] = None,
 ) -> list[Associate]:
@@ -253,107 +476,68 @@ def create_realistic_associates(
     Returns:
         List of associates configured to match the distribution.
     """
+    total_count = sum(cfg.target_count for cfg in shift_start_configs)
+    if total_count <= 0:
+        return []
+
     rng = random.Random(seed if seed is not None else 42)
     associates = []
 
-    # Sample names
-    names = [
-        "Alice", "Bob", "Carol", "David", "Eve", "Frank", "Grace", "Henry",
-        "Ivy", "Jack", "Kate", "Leo", "Mia", "Noah", "Olivia", "Paul",
-        "Quinn", "Rose", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier",
-        "Yara", "Zach", "Amy", "Ben", "Chloe", "Dan", "Emma", "Finn",
-        "Gina", "Hugo", "Iris", "Jake", "Kim", "Luke", "Maya", "Nate",
-    ]
-
-    # Days off patterns - exactly 2 days off per week for full-time
-    # Shuffle the patterns to distribute days off across the week
-    days_off_patterns = [
-        [5, 6],  # Sat-Sun off
-        [0, 1],  # Mon-Tue off
-        [1, 2],  # Tue-Wed off
-        [2, 3],  # Wed-Thu off
-        [3, 4],  # Thu-Fri off
-        [4, 5],  # Fri-Sat off
-        [6, 0],  # Sun-Mon off
-        [0, 3],  # Mon, Thu off (split)
-        [2, 5],  # Wed, Sat off (split)
-        [1, 4],  # Tue, Fri off (split)
-        [0, 4],  # Mon, Fri off (split)
-        [2, 6],  # Wed, Sun off (split)
-        [1, 5],  # Tue, Sat off (split)
-        [3, 6],  # Thu, Sun off (split)
-    ]
-
-    # Role restrictions for variety (most have no restrictions)
-    role_restrictions = [
-        set(),  # No restrictions (most common)
-        set(),
-        set(),
-        set(),
-        set(),
-        {JobRole.BACKROOM},
-        {JobRole.GMD_SM},
-        {JobRole.STAGING},
-        {JobRole.SR},
-    ]
-
-    # Role preferences for variety
-    preference_combos = [
-        {},  # Neutral (most common)
-        {},
-        {},
-        {},
-        {JobRole.PICKING: Preference.PREFER},
-        {JobRole.BACKROOM: Preference.PREFER},
-        {JobRole.STAGING: Preference.PREFER},
-        {JobRole.BACKROOM: Preference.AVOID},
-        {JobRole.SR: Preference.PREFER},
-    ]
-
+    # Per-date off-day flags for each days-off pattern, computed once and
+    # shared by every associate on that pattern. Skip days-off patterns for
+    # single-day schedules so all associates are available.
+    pattern_off_flags: list[tuple[bool, ...]]
+    if len(schedule_dates) == 1:
+        pattern_off_flags = [(False,)]
+    else:
+        weekdays = [d.weekday() for d in schedule_dates]
+        pattern_off_flags = [
+            tuple(bool(mask >> weekday & 1) for weekday in weekdays)
+            for mask in _REALISTIC_DAYS_OFF_MASKS
+        ]
+
+    # Draw every associate's role restriction and preferences up front
+    restriction_draws = rng.choices(_REALISTIC_ROLE_RESTRICTIONS, k=total_count)
+    preference_draws = rng.choices(_REALISTIC_PREFERENCE_COMBOS, k=total_count)
+    names = _sample_names(total_count)
+
+    shared_availability: dict[
+        tuple[Availability, tuple[bool, ...]], Mapping[date, Availability]
+    ] = {}
     associate_idx = 0
 
     # Create associates for each shift start time
     for cfg in shift_start_configs:
-        for _ in range(cfg.target_count):
-            name = names[associate_idx % len(names)]
-            if associate_idx >= len(names):
-                name = f"{name}{associate_idx // len(names) + 1}"
+        # Calculate shift end (8 hours work + 1 hour lunch = 36 slots for 15-min slots)
+        start_slot = cfg.start_slot
+        end_slot = min(start_slot + 36, 68)  # Cap at 10 PM
 
-            # Calculate shift end (8 hours work + 1 hour lunch = 36 slots for 15-min slots)
-            start_slot = cfg.start_slot
-            end_slot = min(start_slot + 36, 68)  # Cap at 10 PM
+        # For closers, extend availability to end of day
+        if start_slot >= 36:  # 2 PM or later
+            end_slot = 68  # Available until 10 PM
 
-            # For closers, extend availability to end of day
-            if start_slot >= 36:  # 2 PM or later
-                end_slot = 68  # Available until 10 PM
+        # Use exact start time to match shift start configs
+        window = _availability(start_slot, end_slot)
 
-            # Select days off pattern - rotate through patterns to ensure coverage
-            # Use index-based selection first, then randomize for duplicates
-            # Skip days-off patterns for single-day schedules so all associates are available
-            if len(schedule_dates) == 1:
-                preferred_days_off = []  # No days off for single-day demo
-            else:
-                pattern_idx = associate_idx % len(days_off_patterns)
-                preferred_days_off = days_off_patterns[pattern_idx]
-
-            cannot_do = rng.choice(role_restrictions)
-            preferences = rng.choice(preference_combos)
-
-            # Build availability for each date - most days should be available
-            availability = {}
-            for d in schedule_dates:
-                weekday = d.weekday()
-                is_day_off = weekday in preferred_days_off
-
-                if is_day_off:
-                    availability[d] = Availability.off_day()
-                else:
-                    # Use exact start time to match shift start configs
-                    availability[d] = Availability(
-                        start_slot=start_slot, end_slot=end_slot
-                    )
+        for _ in range(cfg.target_count):
+            name = names[associate_idx]
 
-            allowed_roles = set(JobRole)
+            # Select days off pattern - rotate through patterns to ensure coverage
+            off_flags = pattern_off_flags[associate_idx % len(pattern_off_flags)]
+
+            cannot_do = restriction_draws[associate_idx]
+            preferences = preference_draws[associate_idx]
+
+            # Build availability for each date - most days should be available.
+            # Associates with the same window and days off share one map.
+            availability = shared_availability.get((window, off_flags))
+            if availability is None:
+                availability = shared_availability[window, off_flags] = (
+                    MappingProxyType({
+                        d: _OFF_DAY if is_off else window
+                        for d, is_off in zip(schedule_dates, off_flags, strict=True)
+                    })
+                )
 
             associate = Associate(
                 id=f"A{associate_idx + 1:03d}",
@@ -361,9 +545,9 @@ def create_realistic_associates(
                 availability=availability,
                 max_minutes_per_day=480,  # 8 hours
                 max_minutes_per_week=2400,  # 40 hours
-                supervisor_allowed_roles=allowed_roles,
-                cannot_do_roles=set(cannot_do),
-                role_preferences=dict(preferences),
+                supervisor_allowed_roles=_ALL_ROLES,
+                cannot_do_roles=cannot_do,
+                role_preferences=preferences,
             )
             associates.append(associate)
             associate_idx += 1
@@ -371,11 +555,30 @@ def create_realistic_associates(
     return associates
 
 
+def _build_schedule_dates(days: int) -> list[date]:
+    """Build the list of dates to schedule, starting today.
+
+    Full-week schedules are shifted forward to start on the next Monday.
+
+    Args:
+        days: Number of days to schedule.
+
+    Returns:
+        Consecutive dates covering the scheduling period.
+    """
+    start_ordinal = date.today().toordinal()
+    if days >= 7:
+        # Ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) % 7 is the weekday
+        start_ordinal += (7 - (start_ordinal - 1) % 7) % 7
+    return [date.fromordinal(start_ordinal + i) for i in range(days)]
+
+
 def run_demo(
     associate_count: int = 10,
     output_path: Optional[str] = None,
     realistic: bool = False,
     seed: Optional[int] = None,
+    validate: bool = True,
 ) -> None:
     """Run a demo schedule generation.
 
@@ -384,18 +587,13 @@ def run_demo(
         output_path: Optional PDF file path for output.
         realistic: Use realistic shift distribution.
         seed: Random seed for reproducibility.
+        validate: Validate the generated schedule.
     """
     schedule_date = date.today()
 
     # Create shift start configs for realistic mode
     if realistic:
-        base_distribution = ShiftStartConfig.create_standard_distribution()
-        if associate_count != 47:  # 47 is the standard total
-            shift_start_configs = ShiftStartConfig.scale_distribution(
-                base_distribution, associate_count
-            )
-        else:
-            shift_start_configs = base_distribution
+        shift_start_configs = _realistic_shift_starts(associate_count)
 
         # Create associates matching the distribution
         associates = create_realistic_associates(
@@ -405,10 +603,9 @@ def run_demo(
 
         print(f"Generating demo schedule for {associate_count} associates...")
         print(f"  Mode: REALISTIC (real shift distribution)")
-        print(f"  Shift starts: ", end="")
-        for cfg in shift_start_configs:
-            print(f"{cfg.label}:{cfg.target_count} ", end="")
-        print()
+        print("  Shift starts: " + "".join(
+            f"{cfg.label}:{cfg.target_count} " for cfg in shift_start_configs
+        ))
     else:
         print(f"Generating demo schedule for {associate_count} associates...")
 
@@ -417,6 +614,9 @@ def run_demo(
             associate_count, [schedule_date], seed=seed
         )
 
+    # Look up associates by id for validation and PDF output
+    associates_map = {a.id: a for a in associates}
+
     # Create schedule request
     # In realistic mode, use 5AM staffing configuration
     slot_range_caps = None
@@ -432,32 +632,41 @@ def run_demo(
     )
 
     # Generate schedule
+    from ogphelper.scheduling.scheduler import Scheduler
+
     scheduler = Scheduler()
     schedule, stats = scheduler.generate_schedule_with_stats(request)
 
-    # Validate
-    validator = ScheduleValidator()
-    associates_map = {a.id: a for a in associates}
-    result = validator.validate(schedule, request, associates_map)
-
-    # Print results
-    print(f"\nSchedule generated for {schedule.schedule_date}")
-    print(f"  Scheduled: {stats['scheduled_associates']}/{stats['total_associates']} associates")
-    print(f"  Total work hours: {stats['total_work_minutes'] / 60:.1f}")
+    # Print results, buffered so the report goes out in a single write
+    out = io.StringIO()
+    print(f"\nSchedule generated for {schedule.schedule_date}", file=out)
+    print(f"  Scheduled: {stats['scheduled_associates']}/{stats['total_associates']} "
+          f"associates", file=out)
+    print(f"  Total work hours: {stats['total_work_minutes'] / 60:.1f}", file=out)
     print(f"  Coverage: min={stats['min_coverage']}, max={stats['max_coverage']}, "
-          f"avg={stats['avg_coverage']:.1f}")
+          f"avg={stats['avg_coverage']:.1f}", file=out)
+
+    if validate:
+        from ogphelper.validation.validator import ScheduleValidator
 
-    if result.is_valid:
-        print("\n  Validation: PASSED")
+        result = ScheduleValidator().validate(schedule, request, associates_map)
+        if result.is_valid:
+            print("\n  Validation: PASSED", file=out)
+        else:
+            print(f"\n  Validation: FAILED ({len(result.errors)} errors)", file=out)
+            for error in result.errors[:5]:
+                print(f"    - {error}", file=out)
+            if len(result.errors) > 5:
+                print(f"    ... and {len(result.errors) - 5} more errors", file=out)
     else:
-        print(f"\n  Validation: FAILED ({len(result.errors)} errors)")
-        for error in result.errors[:5]:
-            print(f"    - {error}")
-        if len(result.errors) > 5:
-            print(f"    ... and {len(result.errors) - 5} more errors")
+        print("\n  Validation: SKIPPED", file=out)
+
+    sys.stdout.write(out.getvalue())
 
     # Generate PDF if requested
     if output_path:
+        from ogphelper.output.pdf_generator import PDFGenerator
+
         print(f"\nGenerating PDF: {output_path}")
         generator = PDFGenerator()
         generator.generate(schedule, associates_map, output_path)
@@ -475,13 +684,15 @@ def run_weekly_demo(
     day_limit: Optional[int] = None,
     closing_limit: Optional[int] = None,
     realistic: bool = False,
+    validate: bool = True,
 ) -> None:
     """Run a weekly schedule generation demo.
 
     Args:
         associate_count: Number of associates to schedule.
         days: Number of days to schedule (default 7 for a week).
-        days_off_pattern: Pattern for days off (none, two_consecutive, one_weekend_day).
+        days_off_pattern: Pattern for days off (none, two_consecutive,
+            one_weekend_day, every_other_day).
         output_path: Optional PDF file path for output.
         variety_level: Level of variety in schedules (low, medium, high).
         seed: Random seed for reproducibility.
@@ -489,28 +700,19 @@ def run_weekly_demo(
         day_limit: Max associates starting in day block (10 AM - 4 PM).
         closing_limit: Max associates starting in closing block (3 PM - 10 PM).
         realistic: Use realistic shift distribution (47 associates standard).
+        validate: Validate the generated schedule.
+
+    Raises:
+        KeyError: If days_off_pattern is not a known pattern.
     """
     # Generate date range
-    start_date = date.today()
-    # Adjust to start on Monday if scheduling a full week
-    if days >= 7:
-        days_until_monday = (7 - start_date.weekday()) % 7
-        if days_until_monday > 0:
-            start_date = start_date + timedelta(days=days_until_monday)
-    end_date = start_date + timedelta(days=days - 1)
-
-    schedule_dates = [start_date + timedelta(days=i) for i in range(days)]
+    schedule_dates = _build_schedule_dates(days)
+    start_date, end_date = schedule_dates[0], schedule_dates[-1]
 
     # Create shift start configs for realistic mode
-    shift_start_configs = None
+    shift_start_configs: Optional[list[ShiftStartConfig]] = None
     if realistic:
-        base_distribution = ShiftStartConfig.create_standard_distribution()
-        if associate_count != 47:  # 47 is the standard total
-            shift_start_configs = ShiftStartConfig.scale_distribution(
-                base_distribution, associate_count
-            )
-        else:
-            shift_start_configs = base_distribution
+        shift_start_configs = _realistic_shift_starts(associate_count)
 
         # Create associates matching the distribution
         associates = create_realistic_associates(
@@ -520,10 +722,9 @@ def run_weekly_demo(
 
         print(f"Generating weekly schedule for {associate_count} associates over {days} days...")
         print(f"  Mode: REALISTIC (real shift distribution)")
-        print(f"  Shift starts: ", end="")
-        for cfg in shift_start_configs:
-            print(f"{cfg.label}:{cfg.target_count} ", end="")
-        print()
+        print("  Shift starts: " + "".join(
+            f"{cfg.label}:{cfg.target_count} " for cfg in shift_start_configs
+        ))
     else:
         print(f"Generating weekly schedule for {associate_count} associates over {days} days...")
         print(f"  Variety level: {variety_level}, Seed: {seed if seed else 'random'}")
@@ -533,50 +734,36 @@ def run_weekly_demo(
             associate_count, schedule_dates, seed=seed, variety_level=variety_level
         )
 
+    # Look up associates by id for validation and PDF output
+    associates_map = {a.id: a for a in associates}
+
     # Parse days-off pattern
     # In realistic mode, days off are already built into associate availability
     if realistic:
         pattern = DaysOffPattern.NONE
         required_days_off = 0
     else:
-        pattern_map = {
-            "none": DaysOffPattern.NONE,
-            "two_consecutive": DaysOffPattern.TWO_CONSECUTIVE,
-            "one_weekend_day": DaysOffPattern.ONE_WEEKEND_DAY,
-            "every_other_day": DaysOffPattern.EVERY_OTHER_DAY,
-        }
-        pattern = pattern_map.get(days_off_pattern, DaysOffPattern.TWO_CONSECUTIVE)
+        pattern = _PATTERN_MAP[days_off_pattern]
         required_days_off = 2
 
     # Create shift block configurations if limits specified (only for non-realistic mode)
     shift_block_configs = None
     if not realistic and any(x is not None for x in [morning_limit, day_limit, closing_limit]):
-        blocks = ShiftBlockConfig.create_default_blocks()
+        limit_map = {
+            ShiftBlockType.MORNING: morning_limit,
+            ShiftBlockType.DAY: day_limit,
+            ShiftBlockType.CLOSING: closing_limit,
+        }
         shift_block_configs = []
-        for block in blocks:
-            if block.block_type == ShiftBlockType.MORNING and morning_limit is not None:
+        for block in ShiftBlockConfig.create_default_blocks():
+            limit = limit_map.get(block.block_type)
+            if limit is not None:
                 block = ShiftBlockConfig(
                     block_type=block.block_type,
                     start_slot=block.start_slot,
                     end_slot=block.end_slot,
-                    max_associates=morning_limit,
-                    target_associates=morning_limit,
-                )
-            elif block.block_type == ShiftBlockType.DAY and day_limit is not None:
-                block = ShiftBlockConfig(
-                    block_type=block.block_type,
-                    start_slot=block.start_slot,
-                    end_slot=block.end_slot,
-                    max_associates=day_limit,
-                    target_associates=day_limit,
-                )
-            elif block.block_type == ShiftBlockType.CLOSING and closing_limit is not None:
-                block = ShiftBlockConfig(
-                    block_type=block.block_type,
-                    start_slot=block.start_slot,
-                    end_slot=block.end_slot,
-                    max_associates=closing_limit,
-                    target_associates=closing_limit,
+                    max_associates=limit,
+                    target_associates=limit,
                 )
             shift_block_configs.append(block)
 
@@ -612,73 +799,87 @@ def run_weekly_demo(
     )
 
     # Generate schedule
+    from ogphelper.scheduling.weekly_scheduler import WeeklyScheduler
+
     scheduler = WeeklyScheduler()
     schedule, stats = scheduler.generate_schedule_with_stats(request, step_slots=4)
 
-    # Validate
-    validator = ScheduleValidator()
-    associates_map = {a.id: a for a in associates}
-    result = validator.validate_weekly_schedule(schedule, request, associates_map)
-
-    # Print results
-    print(f"\n{'=' * 60}")
-    print(f"Weekly Schedule: {start_date} to {end_date}")
-    print(f"{'=' * 60}")
-    print(f"  Total Associates: {stats['total_associates']}")
-    print(f"  Total Shifts: {stats['total_shifts']}")
-    print(f"  Total Work Hours: {stats['total_work_hours']:.1f}")
-    print(f"  Avg Hours/Associate: {stats['avg_hours_per_associate']:.1f}")
-    print(f"  Avg Days/Associate: {stats['avg_days_per_associate']:.1f}")
-
-    # Print daily coverage summary
-    print(f"\nDaily Coverage:")
-    for d, coverage in sorted(stats.get('coverage_by_day', {}).items()):
-        day_name = d.strftime("%A")[:3]
-        print(f"  {d} ({day_name}): min={coverage['min']}, max={coverage['max']}, "
-              f"avg={coverage['avg']:.1f}")
+    # Print results, buffered so the report goes out in a single write
+    out = io.StringIO()
+    print(f"\n{'=' * 60}", file=out)
+    print(f"Weekly Schedule: {start_date} to {end_date}", file=out)
+    print(f"{'=' * 60}", file=out)
+    print(f"  Total Associates: {stats['total_associates']}", file=out)
+    print(f"  Total Shifts: {stats['total_shifts']}", file=out)
+    print(f"  Total Work Hours: {stats['total_work_hours']:.1f}", file=out)
+    print(f"  Avg Hours/Associate: {stats['avg_hours_per_associate']:.1f}", file=out)
+    print(f"  Avg Days/Associate: {stats['avg_days_per_associate']:.1f}", file=out)
+
+    # Print daily coverage summary (the stats are already in date order)
+    print(f"\nDaily Coverage:", file=out)
+    coverage_line = "  %s (%s): min=%d, max=%d, avg=%.1f\n"
+    for d, coverage in stats.get('coverage_by_day', {}).items():
+        day_name = _WEEKDAY_ABBRS[d.weekday()]
+        out.write(coverage_line % (
+            d, day_name, coverage['min'], coverage['max'], coverage['avg']
+        ))
 
     # Print fairness metrics
     if stats['fairness_metrics']:
         metrics = stats['fairness_metrics']
-        print(f"\nFairness Metrics:")
-        print(f"  Avg Hours: {metrics.avg_hours:.1f}")
-        print(f"  Std Dev: {metrics.hours_std_dev:.1f}")
-        print(f"  Min Hours: {metrics.min_hours:.1f}")
-        print(f"  Max Hours: {metrics.max_hours:.1f}")
-        print(f"  Fairness Score: {metrics.fairness_score:.1f}/100")
-
-    # Print validation results
-    if result.is_valid:
-        print(f"\nValidation: PASSED")
+        print(f"\nFairness Metrics:", file=out)
+        print(f"  Avg Hours: {metrics.avg_hours:.1f}", file=out)
+        print(f"  Std Dev: {metrics.hours_std_dev:.1f}", file=out)
+        print(f"  Min Hours: {metrics.min_hours:.1f}", file=out)
+        print(f"  Max Hours: {metrics.max_hours:.1f}", file=out)
+        print(f"  Fairness Score: {metrics.fairness_score:.1f}/100", file=out)
+
+    # Validate and print results
+    if validate:
+        from ogphelper.validation.validator import ScheduleValidator
+
+        result = ScheduleValidator().validate_weekly_schedule(
+            schedule, request, associates_map
+        )
+        if result.is_valid:
+            print(f"\nValidation: PASSED", file=out)
+        else:
+            print(f"\nValidation: FAILED ({len(result.errors)} errors)", file=out)
+            for error in result.errors[:5]:
+                print(f"    - {error}", file=out)
+            if len(result.errors) > 5:
+                print(f"    ... and {len(result.errors) - 5} more errors", file=out)
+
+        if result.warnings:
+            print(f"\nWarnings ({len(result.warnings)}):", file=out)
+            for warning in result.warnings[:3]:
+                print(f"    - {warning}", file=out)
+            if len(result.warnings) > 3:
+                print(f"    ... and {len(result.warnings) - 3} more warnings", file=out)
     else:
-        print(f"\nValidation: FAILED ({len(result.errors)} errors)")
-        for error in result.errors[:5]:
-            print(f"    - {error}")
-        if len(result.errors) > 5:
-            print(f"    ... and {len(result.errors) - 5} more errors")
-
-    if result.warnings:
-        print(f"\nWarnings ({len(result.warnings)}):")
-        for warning in result.warnings[:3]:
-            print(f"    - {warning}")
-        if len(result.warnings) > 3:
-            print(f"    ... and {len(result.warnings) - 3} more warnings")
+        print(f"\nValidation: SKIPPED", file=out)
 
     # Print sample associate schedules
-    print(f"\nSample Associate Schedules:")
-    sample_associates = list(associates)[:3]
+    print(f"\nSample Associate Schedules:", file=out)
+    sample_associates = associates[:3]
     for associate in sample_associates:
         days_worked = schedule.get_associate_days_worked(associate.id)
         hours = schedule.get_associate_weekly_minutes(associate.id) / 60.0
         days_off = schedule.get_associate_days_off(associate.id)
-        days_off_str = ", ".join(d.strftime("%a") for d in sorted(days_off)[:3])
+        days_off_str = ", ".join(
+            _WEEKDAY_ABBRS[d.weekday()] for d in days_off[:3]
+        )
         if len(days_off) > 3:
             days_off_str += f", +{len(days_off) - 3} more"
         print(f"  {associate.name} ({associate.id}): {days_worked} days, "
-              f"{hours:.1f}h, off: {days_off_str}")
+              f"{hours:.1f}h, off: {days_off_str}", file=out)
+
+    sys.stdout.write(out.getvalue())
 
     # Generate PDF if requested
     if output_path:
+        from ogphelper.output.pdf_generator import PDFGenerator
+
         print(f"\nGenerating PDF: {output_path}")
         generator = PDFGenerator()
         generator.generate_weekly(schedule, associates_map, output_path)
@@ -693,6 +894,10 @@ def run_demand_demo(
     time_limit: float = 30.0,
     demand_profile: str = "weekday",
     output_path: Optional[str] = None,
+    tuned_params_path: Optional[str] = None,
+    workers: int = 0,
+    validate: bool = True,
+    hint: bool = True,
 ) -> None:
     """Run a demand-aware schedule generation demo.
 
@@ -704,52 +909,38 @@ def run_demand_demo(
         time_limit: CP-SAT solver time limit in seconds.
         demand_profile: Demand profile to use (weekday, weekend, high_volume).
         output_path: Optional PDF file path for output.
+        tuned_params_path: Optional JSON file of CP-SAT parameter overrides,
+            mapping SatParameters field names to values.
+        workers: CP-SAT search workers (0 = one per CPU core).
+        validate: Validate the generated schedule.
+        hint: Warm-start CP-SAT from the heuristic schedule (hybrid solver).
+
+    Raises:
+        KeyError: If demand_profile is not a known profile.
     """
+    # CP-SAT support pulls in OR-Tools, so only import it for this command
+    from ogphelper.scheduling.cpsat_solver import OptimizationMode, SolverConfig
+    from ogphelper.scheduling.demand_aware_scheduler import (
+        DemandAwareConfig,
+        DemandAwareWeeklyScheduler,
+        SolverType,
+    )
+
     print(f"Generating demand-aware schedule for {associate_count} associates over {days} days...")
     print(f"  Solver: {solver_type}, Optimization: {optimization_mode}")
 
     # Generate date range
-    start_date = date.today()
-    if days >= 7:
-        days_until_monday = (7 - start_date.weekday()) % 7
-        if days_until_monday > 0:
-            start_date = start_date + timedelta(days=days_until_monday)
-    end_date = start_date + timedelta(days=days - 1)
-
-    schedule_dates = [start_date + timedelta(days=i) for i in range(days)]
+    schedule_dates = _build_schedule_dates(days)
+    start_date, end_date = schedule_dates[0], schedule_dates[-1]
 
     # Create sample associates
     associates = create_sample_associates(associate_count, schedule_dates)
+    associates_map = {a.id: a for a in associates}
 
-    # Create demand profiles
-    profile_map = {
-        "weekday": DemandProfile.create_weekday_profile(),
-        "weekend": DemandProfile.create_weekend_profile(),
-        "high_volume": DemandProfile.create_high_volume_profile(),
-    }
-    weekday_profile = profile_map.get(demand_profile, profile_map["weekday"])
-    weekend_profile = profile_map.get("weekend", profile_map["weekend"])
-
-    # Scale profiles based on associate count
+    # Create demand profiles, scaled based on associate count
     scale_factor = max(0.5, min(2.0, associate_count / 10.0))
-    scaled_weekday = DemandProfile(
-        name=weekday_profile.name,
-        description=weekday_profile.description,
-        hourly_pattern={
-            h: max(1, int(v * scale_factor))
-            for h, v in weekday_profile.hourly_pattern.items()
-        },
-        priority_windows=weekday_profile.priority_windows,
-    )
-    scaled_weekend = DemandProfile(
-        name=weekend_profile.name,
-        description=weekend_profile.description,
-        hourly_pattern={
-            h: max(1, int(v * scale_factor))
-            for h, v in weekend_profile.hourly_pattern.items()
-        },
-        priority_windows=weekend_profile.priority_windows,
-    )
+    scaled_weekday = _scaled_profile(demand_profile, scale_factor)
+    scaled_weekend = _scaled_profile("weekend", scale_factor)
 
     # Create weekly demand
     weekly_demand = WeeklyDemand.create_standard_week(
@@ -772,9 +963,15 @@ def run_demand_demo(
     )
 
     # Configure solver
+    parameter_overrides = {}
+    if tuned_params_path:
+        parameter_overrides = json.loads(Path(tuned_params_path).read_text())
+        print(f"  CP-SAT parameters: {tuned_params_path}")
     solver_config = SolverConfig(
         time_limit_seconds=time_limit,
+        num_workers=workers,
         optimization_mode=OptimizationMode(optimization_mode),
+        parameter_overrides=parameter_overrides,
     )
 
     config = DemandAwareConfig(
@@ -782,87 +979,147 @@ def run_demand_demo(
         solver_config=solver_config,
         weekly_demand=weekly_demand,
         track_demand_metrics=True,
+        hint_heuristic=hint,
     )
 
     # Generate schedule
     scheduler = DemandAwareWeeklyScheduler(config=config)
     result = scheduler.generate_schedule(request, weekly_demand, step_slots=4)
 
-    # Validate
-    validator = ScheduleValidator()
-    associates_map = {a.id: a for a in associates}
-    validation_result = validator.validate_weekly_schedule(
-        result.schedule, request, associates_map
-    )
-
-    # Print results
-    print(f"\n{'=' * 60}")
-    print(f"Demand-Aware Weekly Schedule: {start_date} to {end_date}")
-    print(f"{'=' * 60}")
+    # Print results, buffered so the report goes out in a single write
+    out = io.StringIO()
+    print(f"\n{'=' * 60}", file=out)
+    print(f"Demand-Aware Weekly Schedule: {start_date} to {end_date}", file=out)
+    print(f"{'=' * 60}", file=out)
 
     summary = result.get_summary()
-    print(f"  Total Shifts: {summary['total_shifts']}")
-    print(f"  Overall Demand Match: {summary['overall_match_score']:.1f}%")
+    print(f"  Total Shifts: {summary['total_shifts']}", file=out)
+    print(f"  Overall Demand Match: {summary['overall_match_score']:.1f}%", file=out)
     if summary['fairness_score']:
-        print(f"  Fairness Score: {summary['fairness_score']:.1f}/100")
+        print(f"  Fairness Score: {summary['fairness_score']:.1f}/100", file=out)
 
-    # Print daily demand matching
-    print(f"\nDaily Demand Matching:")
-    for d, metrics in sorted(result.demand_metrics.items()):
-        day_name = d.strftime("%A")[:3]
+    # The scheduler fills its per-day results in date order
+    print(f"\nDaily Demand Matching:", file=out)
+    for d, metrics in result.demand_metrics.items():
+        day_name = _WEEKDAY_ABBRS[d.weekday()]
         undercov = metrics.undercoverage_minutes
         match = metrics.match_score
         print(f"  {d} ({day_name}): {match:.1f}% match, "
-              f"undercoverage: {undercov:.0f} min")
+              f"undercoverage: {undercov:.0f} min", file=out)
 
     # Print solver stats
-    print(f"\nSolver Statistics:")
-    for d, stats in sorted(result.solver_stats.items()):
-        day_name = d.strftime("%a")
+    print(f"\nSolver Statistics:", file=out)
+    for d, stats in result.solver_stats.items():
+        day_name = _WEEKDAY_ABBRS[d.weekday()]
         solver_used = stats.get('used', stats.get('method', 'unknown'))
         solve_time = stats.get('solve_time', stats.get('cpsat_time', 0))
         if solve_time:
-            print(f"  {d} ({day_name}): {solver_used}, {solve_time:.2f}s")
+            print(f"  {d} ({day_name}): {solver_used}, {solve_time:.2f}s", file=out)
         else:
-            print(f"  {d} ({day_name}): {solver_used}")
+            print(f"  {d} ({day_name}): {solver_used}", file=out)
 
     # Print coverage summary
-    print(f"\nDaily Coverage Summary:")
-    for d in sorted(result.schedule.day_schedules.keys()):
-        day_schedule = result.schedule.day_schedules[d]
+    print(f"\nDaily Coverage Summary:", file=out)
+    for d, day_schedule in result.schedule.day_schedules.items():
         timeline = day_schedule.get_coverage_timeline()
         if timeline:
-            day_name = d.strftime("%a")
+            day_name = _WEEKDAY_ABBRS[d.weekday()]
             print(f"  {d} ({day_name}): min={min(timeline)}, max={max(timeline)}, "
-                  f"avg={sum(timeline)/len(timeline):.1f}")
+                  f"avg={sum(timeline)/len(timeline):.1f}", file=out)
 
     # Print fairness metrics
     metrics = result.schedule.fairness_metrics
     if metrics:
-        print(f"\nFairness Metrics:")
-        print(f"  Avg Hours: {metrics.avg_hours:.1f}")
-        print(f"  Std Dev: {metrics.hours_std_dev:.1f}")
-        print(f"  Range: {metrics.min_hours:.1f} - {metrics.max_hours:.1f}")
-        print(f"  Fairness Score: {metrics.fairness_score:.1f}/100")
+        print(f"\nFairness Metrics:", file=out)
+        print(f"  Avg Hours: {metrics.avg_hours:.1f}", file=out)
+        print(f"  Std Dev: {metrics.hours_std_dev:.1f}", file=out)
+        print(f"  Range: {metrics.min_hours:.1f} - {metrics.max_hours:.1f}", file=out)
+        print(f"  Fairness Score: {metrics.fairness_score:.1f}/100", file=out)
 
     # Validation
-    if validation_result.is_valid:
-        print(f"\nValidation: PASSED")
+    if validate:
+        from ogphelper.validation.validator import ScheduleValidator
+
+        validation_result = ScheduleValidator().validate_weekly_schedule(
+            result.schedule, request, associates_map
+        )
+        if validation_result.is_valid:
+            print(f"\nValidation: PASSED", file=out)
+        else:
+            print(f"\nValidation: FAILED ({len(validation_result.errors)} errors)", file=out)
+            for error in validation_result.errors[:5]:
+                print(f"    - {error}", file=out)
     else:
-        print(f"\nValidation: FAILED ({len(validation_result.errors)} errors)")
-        for error in validation_result.errors[:5]:
-            print(f"    - {error}")
+        print(f"\nValidation: SKIPPED", file=out)
+
+    sys.stdout.write(out.getvalue())
 
     # Generate PDF if requested
     if output_path:
+        from ogphelper.output.pdf_generator import PDFGenerator
+
         print(f"\nGenerating PDF: {output_path}")
         generator = PDFGenerator()
         generator.generate_weekly(result.schedule, associates_map, output_path)
         print("  PDF created successfully!")
 
 
-def main() -> int:
-    """Main entry point for CLI."""
+def _run_demo_command(args: argparse.Namespace) -> None:
+    run_demo(
+        args.count, args.output, args.realistic, args.seed, not args.no_validate
+    )
+
+
+def _run_weekly_demo_command(args: argparse.Namespace) -> None:
+    run_weekly_demo(
+        args.count,
+        args.days,
+        args.pattern,
+        args.output,
+        args.variety,
+        args.seed,
+        args.morning_limit,
+        args.day_limit,
+        args.closing_limit,
+        args.realistic,
+        not args.no_validate,
+    )
+
+
+def _run_demand_demo_command(args: argparse.Namespace) -> None:
+    run_demand_demo(
+        args.count,
+        args.days,
+        args.solver,
+        args.optimization,
+        args.time_limit,
+        args.profile,
+        args.output,
+        args.tuned_params,
+        args.workers,
+        not args.no_validate,
+        not args.no_hint,
+    )
+
+
+# Subcommand name -> handler taking the parsed arguments
+_COMMANDS: Mapping[str, Callable[[argparse.Namespace], None]] = MappingProxyType({
+    "demo": _run_demo_command,
+    "weekly-demo": _run_weekly_demo_command,
+    "demand-demo": _run_demand_demo_command,
+})
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    The parser is built once and reused, since parse_args() does not
+    modify it.
+
+    Returns:
+        Parser for all subcommands.
+    """
     parser = argparse.ArgumentParser(
         description="OGP Helper - Workforce Scheduling Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -883,6 +1140,10 @@ Examples:
   %(prog)s demand-demo                Run demand-aware demo
   %(prog)s demand-demo --solver cpsat Use CP-SAT solver
   %(prog)s demand-demo --profile high_volume  High-volume demand
+  %(prog)s demand-demo --tuned-params params.json  Tuned CP-SAT parameters
+  %(prog)s demand-demo --workers 1    Single-threaded CP-SAT search
+  %(prog)s demand-demo --no-validate  Skip validation when timing the solver
+  %(prog)s demand-demo --no-hint      Unhinted CP-SAT search, for A/B timing
         """,
     )
 
@@ -911,6 +1172,11 @@ Examples:
         type=int,
         help="Random seed for reproducibility",
     )
+    demo_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip schedule validation (e.g. when only timing the solver)",
+    )
 
     # Weekly demo command
     weekly_parser = subparsers.add_parser(
@@ -973,6 +1239,11 @@ Examples:
         action="store_true",
         help="Use realistic shift distribution (9@5AM, 7@6AM, 5@7AM, 2@8AM, 1@8:30AM, 5@9AM, 1@9:30AM, 3@10AM, 6@11AM, 3@1PM, 5@2PM)",
     )
+    weekly_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip schedule validation (e.g. when only timing the solver)",
+    )
 
     # Demand-aware demo command
     demand_parser = subparsers.add_parser(
@@ -1018,45 +1289,47 @@ Examples:
         choices=["weekday", "weekend", "high_volume"],
         help="Demand profile to use (default: weekday)",
     )
+    demand_parser.add_argument(
+        "--tuned-params",
+        type=str,
+        help="JSON file of CP-SAT parameter overrides (e.g. from autotuning)",
+    )
+    demand_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=0,
+        help="CP-SAT parallel search workers (default: 0 = one per CPU core)",
+    )
+    demand_parser.add_argument(
+        "--no-hint",
+        action="store_true",
+        help="Don't warm-start CP-SAT from the heuristic schedule (hybrid solver)",
+    )
     demand_parser.add_argument(
         "--output", "-o",
         type=str,
         help="Output PDF file path",
     )
+    demand_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip schedule validation (e.g. when only timing the solver)",
+    )
 
+    return parser
+
+
+def main() -> int:
+    """Main entry point for CLI."""
+    parser = _build_parser()
     args = parser.parse_args()
 
-    if args.command == "demo":
-        run_demo(args.count, args.output, args.realistic, args.seed)
-        return 0
-    elif args.command == "weekly-demo":
-        run_weekly_demo(
-            args.count,
-            args.days,
-            args.pattern,
-            args.output,
-            args.variety,
-            args.seed,
-            args.morning_limit,
-            args.day_limit,
-            args.closing_limit,
-            args.realistic,
-        )
-        return 0
-    elif args.command == "demand-demo":
-        run_demand_demo(
-            args.count,
-            args.days,
-            args.solver,
-            args.optimization,
-            args.time_limit,
-            args.profile,
-            args.output,
-        )
-        return 0
-    else:
+    command = _COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
         return 1
+    command(args)
+    return 0
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ This module provides data structures for defining staffing demand at each
 time slot, supporting demand-aware scheduling optimization.
 """
 
+import functools
 from dataclasses import dataclass, field
 from datetime import date, time
 from enum import Enum
@@ -21,7 +22,7 @@ class DemandPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DemandPoint:
     """A single demand point at a specific time.
 
@@ -48,6 +49,12 @@ class DemandPoint:
             object.__setattr__(self, "max_staff", self.target_staff)
 
 
+@functools.lru_cache(maxsize=256)
+def _default_demand_point(slot: int) -> DemandPoint:
+    """Return the shared DemandPoint used for slots with no demand set."""
+    return DemandPoint(slot=slot, min_staff=0, target_staff=1, max_staff=99)
+
+
 @dataclass
 class DemandCurve:
     """Staffing demand curve for a single day.
@@ -78,10 +85,11 @@ class DemandCurve:
 
     def get_demand_at_slot(self, slot: int) -> DemandPoint:
         """Get total demand at a specific slot."""
-        if slot in self.total_demand:
-            return self.total_demand[slot]
-        # Default demand point
-        return DemandPoint(slot=slot, min_staff=0, target_staff=1, max_staff=99)
+        point = self.total_demand.get(slot)
+        if point is None:
+            # DemandPoint is frozen, so one default per slot can be shared
+            return _default_demand_point(slot)
+        return point
 
     def get_role_demand_at_slot(self, slot: int, role: JobRole) -> Optional[DemandPoint]:
         """Get demand for a specific role at a slot."""
@@ -98,17 +106,51 @@ class DemandCurve:
             return self.total_demand[slot].priority
         return DemandPriority.NORMAL
 
+    def get_priority_timeline(
+        self,
+        num_slots: Optional[int] = None,
+    ) -> list[DemandPriority]:
+        """Get the priority level at every slot in one pass.
+
+        Equivalent to calling get_priority_at_slot for each slot, but walks
+        priority_periods once instead of once per slot.
+
+        Args:
+            num_slots: Number of slots to resolve (defaults to total_slots).
+
+        Returns:
+            Priority for each slot index from 0 to num_slots - 1.
+        """
+        if num_slots is None:
+            num_slots = self.total_slots
+        points = self.total_demand
+        normal = DemandPriority.NORMAL
+        timeline = [
+            points[slot].priority if slot in points else normal
+            for slot in range(num_slots)
+        ]
+        # The first matching period wins, so apply periods in reverse
+        for start, end, priority in reversed(self.priority_periods):
+            start = max(start, 0)
+            end = min(end, num_slots)
+            if start < end:
+                timeline[start:end] = [priority] * (end - start)
+        return timeline
+
     def get_min_staff_at_slot(self, slot: int) -> int:
         """Get minimum required staff at a slot."""
-        return self.get_demand_at_slot(slot).min_staff
+        point = self.total_demand.get(slot)
+        return 0 if point is None else point.min_staff
 
     def get_target_staff_at_slot(self, slot: int) -> int:
         """Get target staff at a slot."""
-        return self.get_demand_at_slot(slot).target_staff
+        point = self.total_demand.get(slot)
+        return 1 if point is None else point.target_staff
 
     def get_max_staff_at_slot(self, slot: int) -> int:
         """Get maximum useful staff at a slot."""
-        return self.get_demand_at_slot(slot).max_staff
+        point = self.total_demand.get(slot)
+        return 99 if point is None else point.max_staff
 
     def set_demand(
         self,
@@ -137,8 +179,10 @@ class DemandCurve:
         priority: DemandPriority = DemandPriority.NORMAL,
     ) -> None:
         """Set demand for a range of slots."""
-        for slot in range(start_slot, end_slot):
-            self.set_demand(slot, min_staff, target_staff, max_staff, priority)
+        self.total_demand.update(
+            (slot, DemandPoint(slot, min_staff, target_staff, max_staff, priority))
+            for slot in range(start_slot, end_slot)
+        )
 
     def set_role_demand(
         self,
@@ -167,6 +211,30 @@ class DemandCurve:
         """Add a priority period."""
         self.priority_periods.append((start_slot, end_slot, priority))
 
+    def for_date(self, schedule_date: date) -> "DemandCurve":
+        """Copy this curve for another date.
+
+        The copy has its own slot dicts and priority list, so setting
+        demand on it leaves this curve untouched; the immutable
+        DemandPoints themselves are shared.
+
+        Args:
+            schedule_date: Date for the new demand curve.
+
+        Returns:
+            DemandCurve with the same demand on the given date.
+        """
+        return DemandCurve(
+            schedule_date=schedule_date,
+            total_demand=dict(self.total_demand),
+            role_demand={
+                slot: dict(points) for slot, points in self.role_demand.items()
+            },
+            priority_periods=list(self.priority_periods),
+            slot_minutes=self.slot_minutes,
+            day_start_minutes=self.day_start_minutes,
+        )
+
     @classmethod
     def from_hourly_pattern(
         cls,
@@ -192,18 +260,22 @@ class DemandCurve:
             day_start_minutes=day_start_minutes,
         )
 
-        slots_per_hour = 60 // slot_minutes
         start_hour = day_start_minutes // 60  # 5 for 5AM
+        points = curve.total_demand
+        current_hour = None
 
         for slot in range(curve.total_slots):
-            current_hour = start_hour + (slot * slot_minutes) // 60
-            target = hourly_targets.get(current_hour, 1)
+            hour = start_hour + (slot * slot_minutes) // 60
+            if hour != current_hour:
+                # Targets only change on the hour
+                current_hour = hour
+                target = hourly_targets.get(hour, 1)
 
-            # Set min as 60% of target, max as 150% of target
-            min_staff = max(0, int(target * 0.6))
-            max_staff = int(target * 1.5) + 1
+                # Set min as 60% of target, max as 150% of target
+                min_staff = max(0, int(target * 0.6))
+                max_staff = int(target * 1.5) + 1
 
-            curve.set_demand(
+            points[slot] = DemandPoint(
                 slot=slot,
                 min_staff=min_staff,
                 target_staff=target,
@@ -238,20 +310,29 @@ class DemandCurve:
         slots_per_hour = 60 // slot_minutes
         day_start_hour = 5  # 5 AM
 
+        # (target, min, max, priority) for peak and off-peak slots
+        peak = (
+            peak_demand,
+            max(0, int(peak_demand * 0.6)),
+            int(peak_demand * 1.5) + 1,
+            DemandPriority.HIGH,
+        )
+        off_peak = (
+            base_demand,
+            max(0, int(base_demand * 0.6)),
+            int(base_demand * 1.5) + 1,
+            DemandPriority.NORMAL,
+        )
+        points = curve.total_demand
+
         for slot in range(curve.total_slots):
             current_hour = day_start_hour + (slot * slot_minutes) // 60
-
             if peak_hours[0] <= current_hour < peak_hours[1]:
-                target = peak_demand
-                priority = DemandPriority.HIGH
+                target, min_staff, max_staff, priority = peak
             else:
-                target = base_demand
-                priority = DemandPriority.NORMAL
-
-            min_staff = max(0, int(target * 0.6))
-            max_staff = int(target * 1.5) + 1
+                target, min_staff, max_staff, priority = off_peak
 
-            curve.set_demand(
+            points[slot] = DemandPoint(
                 slot=slot,
                 min_staff=min_staff,
                 target_staff=target,
@@ -305,32 +386,63 @@ class DemandProfile:
         # Add role-specific demand
         slots_per_hour = 60 // slot_minutes
         start_hour = day_start_minutes // 60
+        total_slots = curve.total_slots
 
         for role, pattern in self.role_patterns.items():
             for hour, target in pattern.items():
                 hour_offset = hour - start_hour
                 if hour_offset < 0:
                     continue
-                for i in range(slots_per_hour):
-                    slot = hour_offset * slots_per_hour + i
-                    if slot < curve.total_slots:
-                        curve.set_role_demand(
-                            slot=slot,
-                            role=role,
-                            min_staff=max(0, int(target * 0.6)),
-                            target_staff=target,
-                            max_staff=int(target * 1.5) + 1,
-                        )
+                first_slot = hour_offset * slots_per_hour
+                last_slot = min(first_slot + slots_per_hour, total_slots)
+                min_staff = max(0, int(target * 0.6))
+                max_staff = int(target * 1.5) + 1
+                for slot in range(first_slot, last_slot):
+                    curve.set_role_demand(
+                        slot=slot,
+                        role=role,
+                        min_staff=min_staff,
+                        target_staff=target,
+                        max_staff=max_staff,
+                    )
 
         # Add priority windows
-        day_start_hour = day_start_minutes // 60
         for window_start_hour, window_end_hour, priority in self.priority_windows:
-            start_slot = (window_start_hour - day_start_hour) * slots_per_hour
-            end_slot = (window_end_hour - day_start_hour) * slots_per_hour
+            start_slot = (window_start_hour - start_hour) * slots_per_hour
+            end_slot = (window_end_hour - start_hour) * slots_per_hour
             curve.add_priority_period(start_slot, end_slot, priority)
 
         return curve
 
+    def scaled(self, scale_factor: float) -> "DemandProfile":
+        """Create a copy of this profile with every staffing target scaled.
+
+        Scaled targets are truncated to whole associates, with a floor of 1.
+        Role targets of 0 (no one needed in that role) stay at 0.
+
+        Args:
+            scale_factor: Multiplier applied to each hourly target.
+
+        Returns:
+            New DemandProfile sharing this profile's name and priority windows.
+        """
+        return DemandProfile(
+            name=self.name,
+            description=self.description,
+            hourly_pattern={
+                h: max(1, int(v * scale_factor))
+                for h, v in self.hourly_pattern.items()
+            },
+            role_patterns={
+                role: {
+                    h: max(1, int(v * scale_factor)) if v else 0
+                    for h, v in pattern.items()
+                }
+                for role, pattern in self.role_patterns.items()
+            },
+            priority_windows=self.priority_windows,
+        )
+
     @classmethod
     def create_weekday_profile(cls) -> "DemandProfile":
         """Create a typical weekday demand profile."""
@@ -495,12 +607,18 @@ class WeeklyDemand:
 
         weekly = cls()
 
+        # Each profile's curve is built once and copied to its other dates
+        curves: dict[bool, DemandCurve] = {}
         for i in range(7):
             d = start_date + timedelta(days=i)
-            if d.weekday() < 5:  # Mon-Fri
-                weekly.apply_profile(d, weekday)
-            else:  # Sat-Sun
-                weekly.apply_profile(d, weekend)
+            is_weekend = d.weekday() >= 5
+            template = curves.get(is_weekend)
+            if template is None:
+                profile = weekend if is_weekend else weekday
+                template = curves[is_weekend] = profile.to_demand_curve(d)
+                weekly.demand_curves[d] = template
+            else:
+                weekly.demand_curves[d] = template.for_date(d)
 
         return weekly
 
@@ -551,42 +669,43 @@ class DemandMetrics:
         slot_deficits = []
         slot_surpluses = []
 
-        priority_demand: dict[DemandPriority, float] = {}
-        priority_coverage: dict[DemandPriority, float] = {}
+        # [target, capped coverage] totals for each priority level
+        priority_totals = {priority: [0, 0] for priority in DemandPriority}
+
+        get_demand = demand_curve.get_demand_at_slot
+        priorities = demand_curve.get_priority_timeline(len(coverage_timeline))
 
         for slot, coverage in enumerate(coverage_timeline):
-            demand_point = demand_curve.get_demand_at_slot(slot)
-            priority = demand_curve.get_priority_at_slot(slot)
+            demand_point = get_demand(slot)
 
             target = demand_point.target_staff
             min_staff = demand_point.min_staff
             max_staff = demand_point.max_staff
 
-            # Track by priority
-            priority_demand[priority] = priority_demand.get(priority, 0) + target
-            priority_coverage[priority] = priority_coverage.get(priority, 0) + min(
-                coverage, target
-            )
+            totals = priority_totals[priorities[slot]]
+            totals[0] += target
+            totals[1] += coverage if coverage < target else target
 
             total_demand += target
-            total_coverage += min(coverage, max_staff)
 
             if coverage < min_staff:
+                total_coverage += coverage
                 undercoverage += (min_staff - coverage) * slot_minutes
                 slot_deficits.append(slot)
             elif coverage > max_staff:
+                total_coverage += max_staff
                 overcoverage += (coverage - max_staff) * slot_minutes
                 slot_surpluses.append(slot)
+            else:
+                total_coverage += coverage
 
         # Calculate match scores
         match_score = (total_coverage / total_demand * 100) if total_demand > 0 else 100.0
 
         priority_scores = {}
-        for priority in DemandPriority:
-            if priority in priority_demand and priority_demand[priority] > 0:
-                priority_scores[priority] = (
-                    priority_coverage[priority] / priority_demand[priority] * 100
-                )
+        for priority, (priority_demand, priority_coverage) in priority_totals.items():
+            if priority_demand > 0:
+                priority_scores[priority] = priority_coverage / priority_demand * 100
 
         return cls(
             total_demand_minutes=total_demand * slot_minutes,
@@ -4,9 +4,12 @@ This module contains all core data structures used throughout the scheduling
 system, including associates, time slots, shifts, and schedule outputs.
 """
 
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
-from datetime import date, time, timedelta
+from datetime import date, time
 from enum import Enum
+from itertools import accumulate
 from typing import Optional
 
 
@@ -366,10 +369,13 @@ class TimeSlot:
         return f"TimeSlot({self.start_time.strftime('%H:%M')}-{self.end_time.strftime('%H:%M')})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Availability:
     """Defines when an associate is available to work.
 
+    Availability is immutable, so a single instance can be shared across
+    many associates and dates.
+
     Attributes:
         start_slot: First slot the associate can start working.
         end_slot: Last slot the associate can work (exclusive).
@@ -416,7 +422,15 @@ class Availability:
         return self.end_slot - self.start_slot
 
 
-@dataclass
+# Shared result for dates with no availability entry
+_NO_AVAILABILITY = Availability.off_day()
+
+# Shared default role sets; associates never mutate their role sets
+_ALL_ROLES: frozenset[JobRole] = frozenset(JobRole)
+_NO_ROLES: frozenset[JobRole] = frozenset()
+
+
+@dataclass(slots=True)
 class Associate:
     """Represents an associate who can be scheduled.
 
@@ -429,22 +443,24 @@ class Associate:
         supervisor_allowed_roles: Roles the supervisor has approved (hard constraint).
         cannot_do_roles: Roles the associate physically cannot do (hard constraint).
         role_preferences: Soft preferences for each role.
+
+    The availability mapping, role sets and preferences are treated as
+    read-only, so shared frozensets and mappings may be passed in without
+    copying.
     """
 
     id: str
     name: str
-    availability: dict[date, Availability] = field(default_factory=dict)
+    availability: Mapping[date, Availability] = field(default_factory=dict)
     max_minutes_per_day: int = 480  # 8 hours default
     max_minutes_per_week: int = 2400  # 40 hours default
-    supervisor_allowed_roles: set[JobRole] = field(
-        default_factory=lambda: set(JobRole)
-    )
-    cannot_do_roles: set[JobRole] = field(default_factory=set)
-    role_preferences: dict[JobRole, Preference] = field(default_factory=dict)
+    supervisor_allowed_roles: AbstractSet[JobRole] = _ALL_ROLES
+    cannot_do_roles: AbstractSet[JobRole] = _NO_ROLES
+    role_preferences: Mapping[JobRole, Preference] = field(default_factory=dict)
 
     def get_availability(self, schedule_date: date) -> Availability:
         """Get availability for a specific date."""
-        return self.availability.get(schedule_date, Availability.off_day())
+        return self.availability.get(schedule_date, _NO_AVAILABILITY)
 
     def can_do_role(self, role: JobRole) -> bool:
         """Check if associate can be assigned to a role (hard constraints only)."""
@@ -460,7 +476,11 @@ class Associate:
 
     def eligible_roles(self) -> set[JobRole]:
         """Get all roles this associate can be assigned to."""
-        return self.supervisor_allowed_roles - self.cannot_do_roles
+        return {
+            role
+            for role in self.supervisor_allowed_roles
+            if role not in self.cannot_do_roles
+        }
 
 
 @dataclass(frozen=True)
@@ -583,6 +603,33 @@ class ShiftAssignment:
                 return False
         return True
 
+    def get_on_floor_intervals(self) -> list[tuple[int, int]]:
+        """Get the (start, end) slot ranges where the associate is on floor.
+
+        Ranges are disjoint, in order, and end-exclusive, covering exactly
+        the slots for which is_on_floor() is True.
+        """
+        off_blocks = sorted(
+            (block.start_slot, block.end_slot)
+            for block in (
+                [self.lunch_block, *self.break_blocks]
+                if self.lunch_block
+                else self.break_blocks
+            )
+        )
+
+        intervals = []
+        cursor = self.shift_start_slot
+        for start, end in off_blocks:
+            if cursor >= self.shift_end_slot:
+                break
+            if start > cursor:
+                intervals.append((cursor, min(start, self.shift_end_slot)))
+            cursor = max(cursor, end)
+        if cursor < self.shift_end_slot:
+            intervals.append((cursor, self.shift_end_slot))
+        return intervals
+
     def get_role_at_slot(self, slot: int) -> Optional[JobRole]:
         """Get the assigned role at a specific slot, if any."""
         for assignment in self.job_assignments:
@@ -590,6 +637,18 @@ class ShiftAssignment:
                 return assignment.role
         return None
 
+    def get_roles_by_slot(self) -> dict[int, JobRole]:
+        """Get the assigned role for every slot that has one.
+
+        Matches get_role_at_slot(): where job blocks overlap, the earliest
+        job assignment wins.
+        """
+        roles: dict[int, JobRole] = {}
+        for assignment in self.job_assignments:
+            for slot in range(assignment.block.start_slot, assignment.block.end_slot):
+                roles.setdefault(slot, assignment.role)
+        return roles
+
 
 @dataclass
 class ScheduleRequest:
@@ -706,9 +765,40 @@ class DaySchedule:
                 count += 1
         return count
 
+    def get_role_coverage_timeline(self) -> dict[JobRole, list[int]]:
+        """Get per-role coverage counts for each slot in the day.
+
+        Equivalent to get_role_coverage_at_slot() for every slot and role,
+        but visits each assignment's on-floor slots once.
+        """
+        total_slots = self.total_slots
+        timeline = {role: [0] * total_slots for role in JobRole}
+        for assignment in self.assignments.values():
+            roles = assignment.get_roles_by_slot()
+            for start, end in assignment.get_on_floor_intervals():
+                for slot in range(max(start, 0), min(end, total_slots)):
+                    role = roles.get(slot)
+                    if role is not None:
+                        timeline[role][slot] += 1
+        return timeline
+
     def get_coverage_timeline(self) -> list[int]:
-        """Get coverage count for each slot in the day."""
-        return [self.get_coverage_at_slot(slot) for slot in range(self.total_slots)]
+        """Get coverage count for each slot in the day.
+
+        Built from each assignment's on-floor intervals as a difference
+        array, rather than testing every assignment at every slot.
+        """
+        total_slots = self.total_slots
+        deltas = [0] * (total_slots + 1)
+        for assignment in self.assignments.values():
+            for start, end in assignment.get_on_floor_intervals():
+                start = max(start, 0)
+                end = min(end, total_slots)
+                if start < end:
+                    deltas[start] += 1
+                    deltas[end] -= 1
+        deltas.pop()
+        return list(accumulate(deltas))
 
     def get_on_lunch_at_slot(self, slot: int) -> list[str]:
         """Get list of associate IDs on lunch at a given slot."""
@@ -809,12 +899,11 @@ class WeeklyScheduleRequest:
     @property
     def schedule_dates(self) -> list[date]:
         """List of all dates in the scheduling period."""
-        dates = []
-        current = self.start_date
-        while current <= self.end_date:
-            dates.append(current)
-            current += timedelta(days=1)
-        return dates
+        start = self.start_date.toordinal()
+        return [
+            date.fromordinal(ordinal)
+            for ordinal in range(start, self.end_date.toordinal() + 1)
+        ]
 
     @property
     def num_days(self) -> int:
@@ -918,12 +1007,11 @@ class WeeklySchedule:
     @property
     def schedule_dates(self) -> list[date]:
         """List of all dates in the schedule."""
-        dates = []
-        current = self.start_date
-        while current <= self.end_date:
-            dates.append(current)
-            current += timedelta(days=1)
-        return dates
+        start = self.start_date.toordinal()
+        return [
+            date.fromordinal(ordinal)
+            for ordinal in range(start, self.end_date.toordinal() + 1)
+        ]
 
     @property
     def num_days(self) -> int:
@@ -947,15 +1035,13 @@ class WeeklySchedule:
         return count
 
     def get_associate_days_off(self, associate_id: str) -> list[date]:
-        """Get list of dates when an associate is not scheduled."""
-        days_off = []
-        for d in self.schedule_dates:
-            if d in self.day_schedules:
-                if associate_id not in self.day_schedules[d].assignments:
-                    days_off.append(d)
-            else:
-                days_off.append(d)
-        return days_off
+        """Get list of dates when an associate is not scheduled, in date order."""
+        day_schedules = self.day_schedules
+        return [
+            d for d in self.schedule_dates
+            if d not in day_schedules
+            or associate_id not in day_schedules[d].assignments
+        ]
 
     def get_total_coverage_by_day(self) -> dict[date, list[int]]:
         """Get coverage timeline for each day."""
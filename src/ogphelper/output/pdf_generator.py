@@ -32,6 +32,9 @@ COLORS = {
     "off_shift": (0.95, 0.95, 0.95),  # Light gray
 }
 
+# Day labels indexed by date.weekday(); avoids per-row strftime
+_WEEKDAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 
 class PDFGenerator:
     """Generates printable PDF schedules.
@@ -272,8 +275,8 @@ class PDFGenerator:
         coverage_by_day = summary.get('coverage_by_day', {})
         for d in sorted(schedule.day_schedules.keys()):
             coverage = coverage_by_day.get(d, {"min": 0, "max": 0, "avg": 0})
-            day_name = d.strftime("%A")[:3]
-            c.drawString(cols[0], y, d.strftime("%m/%d"))
+            day_name = _WEEKDAY_ABBRS[d.weekday()]
+            c.drawString(cols[0], y, f"{d.month:02d}/{d.day:02d}")
             c.drawString(cols[1], y, day_name)
             c.drawString(cols[2], y, str(coverage['min']))
             c.drawString(cols[3], y, str(coverage['max']))
@@ -651,11 +654,9 @@ class PDFGenerator:
         y -= 15
 
         c.setFont("Helvetica", 9)
+        role_timeline = schedule.get_role_coverage_timeline()
         for role in JobRole:
-            role_coverage = [
-                schedule.get_role_coverage_at_slot(slot, role)
-                for slot in range(schedule.total_slots)
-            ]
+            role_coverage = role_timeline[role]
             # Sample at hourly intervals
             hourly = role_coverage[::4]
             max_count = max(role_coverage) if role_coverage else 0
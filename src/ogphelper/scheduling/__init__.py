@@ -1,24 +1,58 @@
-"""Scheduling engine for generating associate schedules."""
+"""Scheduling engine for generating associate schedules.
+
+The CP-SAT based exports pull in OR-Tools, which is slow to import, so they
+are loaded on first access rather than with the package.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from ogphelper.scheduling.candidate_generator import CandidateGenerator
-from ogphelper.scheduling.cpsat_solver import (
-    CPSATSolver,
-    DemandAwareSolver,
-    OptimizationMode,
-    SolverConfig,
-    SolverResult,
-)
-from ogphelper.scheduling.demand_aware_scheduler import (
-    DemandAwareConfig,
-    DemandAwareWeeklyResult,
-    DemandAwareWeeklyScheduler,
-    SolverType,
-    create_demand_aware_scheduler,
-)
 from ogphelper.scheduling.heuristic_solver import HeuristicSolver
 from ogphelper.scheduling.scheduler import Scheduler
 from ogphelper.scheduling.weekly_scheduler import WeeklyScheduler
 
+if TYPE_CHECKING:
+    from ogphelper.scheduling.cpsat_solver import (
+        CPSATSolver,
+        DemandAwareSolver,
+        OptimizationMode,
+        SolverConfig,
+        SolverResult,
+    )
+    from ogphelper.scheduling.demand_aware_scheduler import (
+        DemandAwareConfig,
+        DemandAwareWeeklyResult,
+        DemandAwareWeeklyScheduler,
+        SolverType,
+        create_demand_aware_scheduler,
+    )
+
+# Lazily imported exports, mapped to the module that defines them
+_LAZY_EXPORTS = {
+    "CPSATSolver": "ogphelper.scheduling.cpsat_solver",
+    "DemandAwareSolver": "ogphelper.scheduling.cpsat_solver",
+    "OptimizationMode": "ogphelper.scheduling.cpsat_solver",
+    "SolverConfig": "ogphelper.scheduling.cpsat_solver",
+    "SolverResult": "ogphelper.scheduling.cpsat_solver",
+    "DemandAwareConfig": "ogphelper.scheduling.demand_aware_scheduler",
+    "DemandAwareWeeklyResult": "ogphelper.scheduling.demand_aware_scheduler",
+    "DemandAwareWeeklyScheduler": "ogphelper.scheduling.demand_aware_scheduler",
+    "SolverType": "ogphelper.scheduling.demand_aware_scheduler",
+    "create_demand_aware_scheduler": "ogphelper.scheduling.demand_aware_scheduler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a CP-SAT based export on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Core schedulers
     "Scheduler",
@@ -128,34 +128,38 @@ class CandidateGenerator:
             # Not enough availability for minimum shift
             return []
 
+        # Shift shapes depend only on work length, not on the start slot, so
+        # the policy lookups run once per length rather than once per start
+        shapes = []
+        for work_slots in range(min_work_slots, max_work_slots + 1, step_slots):
+            work_minutes = work_slots * slot_minutes
+
+            # Check daily hour limit
+            if work_minutes > associate.max_minutes_per_day:
+                continue
+
+            # Calculate lunch requirement
+            lunch_minutes = self.lunch_policy.get_lunch_duration(work_minutes)
+            lunch_slots = lunch_minutes // slot_minutes
+
+            # Total shift includes work + lunch
+            shapes.append((
+                work_minutes,
+                lunch_slots,
+                work_slots + lunch_slots,
+                self.break_policy.get_break_count(work_minutes),
+            ))
+
         # Generate all valid start/end combinations
         for start_slot in range(avail_start, avail_end, step_slots):
-            for work_slots in range(min_work_slots, max_work_slots + 1, step_slots):
-                work_minutes = work_slots * slot_minutes
-
-                # Check daily hour limit
-                if work_minutes > associate.max_minutes_per_day:
-                    continue
-
-                # Calculate lunch requirement
-                lunch_minutes = self.lunch_policy.get_lunch_duration(work_minutes)
-                lunch_slots = lunch_minutes // slot_minutes
-
-                # Total shift includes work + lunch
-                total_slots = work_slots + lunch_slots
+            for work_minutes, lunch_slots, total_slots, break_count in shapes:
                 end_slot = start_slot + total_slots
 
-                # Check if shift fits within availability
+                # Check if shift fits within availability (and so the day,
+                # since avail_end is clamped to the day bounds)
                 if end_slot > avail_end:
                     continue
 
-                # Check if shift fits within day bounds
-                if end_slot > day_slots:
-                    continue
-
-                # Calculate break count
-                break_count = self.break_policy.get_break_count(work_minutes)
-
                 candidate = ShiftCandidate(
                     associate_id=associate.id,
                     start_slot=start_slot,
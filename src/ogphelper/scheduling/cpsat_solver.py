@@ -8,7 +8,7 @@ curves while respecting all constraints.
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from ortools.sat.python import cp_model
 
@@ -57,6 +57,15 @@ class SolverConfig:
         overcoverage_penalty: Penalty multiplier for being over max demand.
         priority_multipliers: Multipliers for different priority levels.
         enforce_min_demand: If True, min_demand is a hard constraint.
+        linearization_level: CP-SAT linearization level (None = solver default).
+            Level 0 often finds solutions faster on small, tightly capped days.
+        probing_level: CP-SAT presolve probing level (None = solver default).
+        boolean_encoding_level: CP-SAT Boolean encoding level (None = solver
+            default).
+        optimize_with_core: Use core-based optimization (None = solver default).
+        parameter_overrides: Extra CP-SAT parameters by field name, applied
+            after the settings above (e.g. the output of an autotuning run).
+            Enum values are given by name, such as "PORTFOLIO_SEARCH".
     """
 
     time_limit_seconds: float = 30.0
@@ -77,6 +86,11 @@ class SolverConfig:
         }
     )
     enforce_min_demand: bool = False
+    linearization_level: Optional[int] = None
+    probing_level: Optional[int] = None
+    boolean_encoding_level: Optional[int] = None
+    optimize_with_core: Optional[bool] = None
+    parameter_overrides: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -108,6 +122,41 @@ class SolverResult:
         return self.status in ("OPTIMAL", "FEASIBLE")
 
 
+def _apply_parameter_overrides(parameters: Any, overrides: dict[str, Any]) -> None:
+    """Merge parameter overrides into CP-SAT solver parameters.
+
+    Overrides go through the parameters' text format, which accepts enum
+    values by name on every supported OR-Tools version.
+
+    Args:
+        parameters: The CpSolver's parameters object.
+        overrides: Mapping of SatParameters field name to value; list values
+            set repeated fields.
+
+    Raises:
+        ValueError: If a field name or value is not valid for SatParameters.
+    """
+    entries = []
+    for name, value in overrides.items():
+        for item in value if isinstance(value, (list, tuple)) else (value,):
+            if isinstance(item, bool):
+                item = "true" if item else "false"
+            entries.append(f"{name}: {item}")
+    text = " ".join(entries)
+
+    merge_text_format = getattr(parameters, "merge_text_format", None)
+    if merge_text_format is not None:
+        if not merge_text_format(text):
+            raise ValueError(f"Invalid CP-SAT parameter overrides: {text}")
+    else:
+        from google.protobuf import text_format
+
+        try:
+            text_format.Merge(text, parameters)
+        except text_format.ParseError as e:
+            raise ValueError(f"Invalid CP-SAT parameter overrides: {e}") from e
+
+
 class CPSATSolver:
     """Constraint Programming solver using OR-Tools CP-SAT.
 
@@ -124,6 +173,36 @@ class CPSATSolver:
         self.lunch_policy = lunch_policy or DefaultLunchPolicy()
         self.break_policy = break_policy or DefaultBreakPolicy()
         self.config = config or SolverConfig()
+        # Lunch windows keyed by shift geometry, shared across daily solves
+        self._lunch_windows: dict[tuple[int, int, int, bool, int], tuple[int, int]] = {}
+
+    def _get_lunch_window(
+        self, candidate: ShiftCandidate, is_busy_day: bool
+    ) -> tuple[int, int]:
+        """Get the lunch window for a candidate, reusing earlier results.
+
+        Consecutive days mostly regenerate the same shift shapes, so the
+        window is computed once per distinct shape for the solver's lifetime.
+
+        Args:
+            candidate: Shift candidate that needs a lunch.
+            is_busy_day: Whether the schedule day is busy.
+
+        Returns:
+            Tuple of (earliest_start_slot, latest_start_slot) for lunch.
+        """
+        key = (
+            candidate.start_slot,
+            candidate.end_slot,
+            candidate.lunch_slots,
+            is_busy_day,
+            candidate.slot_minutes,
+        )
+        window = self._lunch_windows.get(key)
+        if window is None:
+            window = self.lunch_policy.get_lunch_window(*key)
+            self._lunch_windows[key] = window
+        return window
 
     def solve(
         self,
@@ -131,6 +210,7 @@ class CPSATSolver:
         candidates: dict[str, list[ShiftCandidate]],
         associates_map: dict[str, Associate],
         demand_curve: Optional[DemandCurve] = None,
+        hint: Optional[DaySchedule] = None,
     ) -> SolverResult:
         """Solve the scheduling problem using CP-SAT.
 
@@ -139,6 +219,7 @@ class CPSATSolver:
             candidates: Pre-generated candidates per associate.
             associates_map: Dict mapping associate IDs to Associate objects.
             demand_curve: Optional demand curve to optimize against.
+            hint: Optional known schedule used to warm-start the search.
 
         Returns:
             SolverResult with schedule and solver statistics.
@@ -165,12 +246,8 @@ class CPSATSolver:
                 if candidate.lunch_slots > 0:
                     lunch_vars[assoc_id][c_idx] = {}
                     # Get lunch window
-                    earliest, latest = self.lunch_policy.get_lunch_window(
-                        candidate.start_slot,
-                        candidate.end_slot,
-                        candidate.lunch_slots,
-                        request.is_busy_day,
-                        candidate.slot_minutes,
+                    earliest, latest = self._get_lunch_window(
+                        candidate, request.is_busy_day
                     )
                     for lunch_start in range(earliest, latest + 1):
                         lunch_vars[assoc_id][c_idx][lunch_start] = model.NewBoolVar(
@@ -188,42 +265,52 @@ class CPSATSolver:
                         sum(lunch_vars[assoc_id][c_idx].values()) == 0
                     ).OnlyEnforceIf(x[assoc_id][c_idx].Not())
 
+        # Index the candidates covering each slot once; the coverage and role
+        # cap constraints below both walk these lists in associate order
+        slot_candidates: list[list[tuple[str, int, ShiftCandidate]]] = [
+            [] for _ in range(total_slots)
+        ]
+        for assoc_id, assoc_candidates in candidates.items():
+            for c_idx, candidate in enumerate(assoc_candidates):
+                for slot in range(candidate.start_slot, min(candidate.end_slot, total_slots)):
+                    slot_candidates[slot].append((assoc_id, c_idx, candidate))
+
         # Calculate coverage at each slot
         coverage = []
         for slot in range(total_slots):
             slot_coverage = []
-            for assoc_id, assoc_candidates in candidates.items():
-                for c_idx, candidate in enumerate(assoc_candidates):
-                    if candidate.start_slot <= slot < candidate.end_slot:
-                        # Check if on lunch at this slot
-                        if candidate.lunch_slots > 0 and c_idx in lunch_vars.get(assoc_id, {}):
-                            # Create a variable for "on floor at this slot"
-                            on_floor = model.NewBoolVar(f"floor_{assoc_id}_{c_idx}_{slot}")
-
-                            # Associate is on floor if:
-                            # - Candidate is selected AND
-                            # - Not on lunch at this slot
-                            lunch_at_slot = []
-                            for lunch_start, lunch_var in lunch_vars[assoc_id][c_idx].items():
-                                if lunch_start <= slot < lunch_start + candidate.lunch_slots:
-                                    lunch_at_slot.append(lunch_var)
-
-                            if lunch_at_slot:
-                                # on_floor = x[assoc_id][c_idx] AND NOT any(lunch_at_slot)
-                                # not_on_lunch is true iff NONE of the lunch_at_slot vars are true
-                                not_on_lunch = model.NewBoolVar(f"not_lunch_{assoc_id}_{c_idx}_{slot}")
-                                # If not_on_lunch, all lunch vars for this slot must be false
-                                model.AddBoolAnd([v.Not() for v in lunch_at_slot]).OnlyEnforceIf(not_on_lunch)
-                                # If NOT not_on_lunch (i.e., on lunch), at least one must be true
-                                model.AddBoolOr(lunch_at_slot).OnlyEnforceIf(not_on_lunch.Not())
-
-                                model.AddBoolAnd([x[assoc_id][c_idx], not_on_lunch]).OnlyEnforceIf(on_floor)
-                                model.AddBoolOr([x[assoc_id][c_idx].Not(), not_on_lunch.Not()]).OnlyEnforceIf(on_floor.Not())
-                                slot_coverage.append(on_floor)
-                            else:
-                                slot_coverage.append(x[assoc_id][c_idx])
-                        else:
-                            slot_coverage.append(x[assoc_id][c_idx])
+            for assoc_id, c_idx, candidate in slot_candidates[slot]:
+                # Check if on lunch at this slot
+                candidate_lunch_vars = lunch_vars[assoc_id].get(c_idx)
+                if candidate_lunch_vars:
+                    # Create a variable for "on floor at this slot"
+                    on_floor = model.NewBoolVar(f"floor_{assoc_id}_{c_idx}_{slot}")
+
+                    # Associate is on floor if:
+                    # - Candidate is selected AND
+                    # - Not on lunch at this slot
+                    lunch_at_slot = [
+                        lunch_var
+                        for lunch_start, lunch_var in candidate_lunch_vars.items()
+                        if lunch_start <= slot < lunch_start + candidate.lunch_slots
+                    ]
+
+                    if lunch_at_slot:
+                        # on_floor = x[assoc_id][c_idx] AND NOT any(lunch_at_slot)
+                        # not_on_lunch is true iff NONE of the lunch_at_slot vars are true
+                        not_on_lunch = model.NewBoolVar(f"not_lunch_{assoc_id}_{c_idx}_{slot}")
+                        # If not_on_lunch, all lunch vars for this slot must be false
+                        model.AddBoolAnd([v.Not() for v in lunch_at_slot]).OnlyEnforceIf(not_on_lunch)
+                        # If NOT not_on_lunch (i.e., on lunch), at least one must be true
+                        model.AddBoolOr(lunch_at_slot).OnlyEnforceIf(not_on_lunch.Not())
+
+                        model.AddBoolAnd([x[assoc_id][c_idx], not_on_lunch]).OnlyEnforceIf(on_floor)
+                        model.AddBoolOr([x[assoc_id][c_idx].Not(), not_on_lunch.Not()]).OnlyEnforceIf(on_floor.Not())
+                        slot_coverage.append(on_floor)
+                    else:
+                        slot_coverage.append(x[assoc_id][c_idx])
+                else:
+                    slot_coverage.append(x[assoc_id][c_idx])
 
             coverage.append(sum(slot_coverage) if slot_coverage else 0)
 
@@ -231,14 +318,18 @@ class CPSATSolver:
         for role in JobRole:
             cap = request.job_caps.get(role, 999)
             if cap < 999:
+                capable = {
+                    assoc_id
+                    for assoc_id in candidates
+                    if assoc_id in associates_map
+                    and associates_map[assoc_id].can_do_role(role)
+                }
                 for slot in range(total_slots):
-                    role_assignments = []
-                    for assoc_id, assoc_candidates in candidates.items():
-                        associate = associates_map.get(assoc_id)
-                        if associate and associate.can_do_role(role):
-                            for c_idx, candidate in enumerate(assoc_candidates):
-                                if candidate.start_slot <= slot < candidate.end_slot:
-                                    role_assignments.append(x[assoc_id][c_idx])
+                    role_assignments = [
+                        x[assoc_id][c_idx]
+                        for assoc_id, c_idx, _ in slot_candidates[slot]
+                        if assoc_id in capable
+                    ]
                     if role_assignments:
                         model.Add(sum(role_assignments) <= cap)
 
@@ -255,9 +346,10 @@ class CPSATSolver:
 
         # Demand matching component
         if demand_curve and self.config.demand_weight > 0:
+            priorities = demand_curve.get_priority_timeline(total_slots)
             for slot in range(total_slots):
                 demand_point = demand_curve.get_demand_at_slot(slot)
-                priority = demand_curve.get_priority_at_slot(slot)
+                priority = priorities[slot]
                 priority_mult = self.config.priority_multipliers.get(priority, 1)
 
                 target = demand_point.target_staff
@@ -293,16 +385,16 @@ class CPSATSolver:
                 associate = associates_map.get(assoc_id)
                 if not associate:
                     continue
-                for c_idx, candidate in enumerate(assoc_candidates):
-                    # Calculate preference score for this candidate
-                    pref_score = 0
-                    eligible_roles = associate.eligible_roles()
-                    for role in eligible_roles:
-                        pref = associate.get_preference(role)
-                        if pref == Preference.PREFER:
-                            pref_score += 1
-                        elif pref == Preference.AVOID:
-                            pref_score -= 1
+                # The preference score depends only on the associate, so it
+                # is the same for every one of their candidates
+                pref_score = 0
+                for role in associate.eligible_roles():
+                    pref = associate.get_preference(role)
+                    if pref == Preference.PREFER:
+                        pref_score += 1
+                    elif pref == Preference.AVOID:
+                        pref_score -= 1
+                for c_idx in range(len(assoc_candidates)):
                     objective_terms.append(x[assoc_id][c_idx] * pref_score * self.config.preference_weight)
 
         # Add shift length bonus (prefer longer shifts for better coverage)
@@ -314,11 +406,29 @@ class CPSATSolver:
         # Maximize objective
         model.Maximize(sum(objective_terms))
 
+        # Warm-start from a known schedule if one was provided
+        if hint is not None:
+            self._add_solution_hint(model, x, lunch_vars, candidates, hint)
+
         # Solve
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = self.config.time_limit_seconds
         if self.config.num_workers > 0:
             solver.parameters.num_workers = self.config.num_workers
+        if self.config.linearization_level is not None:
+            solver.parameters.linearization_level = self.config.linearization_level
+        if self.config.probing_level is not None:
+            solver.parameters.cp_model_probing_level = self.config.probing_level
+        if self.config.boolean_encoding_level is not None:
+            solver.parameters.boolean_encoding_level = (
+                self.config.boolean_encoding_level
+            )
+        if self.config.optimize_with_core is not None:
+            solver.parameters.optimize_with_core = self.config.optimize_with_core
+        if self.config.parameter_overrides:
+            _apply_parameter_overrides(
+                solver.parameters, self.config.parameter_overrides
+            )
 
         status = solver.Solve(model)
 
@@ -358,6 +468,39 @@ class CPSATSolver:
             num_conflicts=solver.NumConflicts(),
         )
 
+    def _add_solution_hint(
+        self,
+        model: cp_model.CpModel,
+        x: dict[str, dict[int, cp_model.IntVar]],
+        lunch_vars: dict[str, dict[int, dict[int, cp_model.IntVar]]],
+        candidates: dict[str, list[ShiftCandidate]],
+        hint: DaySchedule,
+    ) -> None:
+        """Hint the shift and lunch variables matching an existing schedule."""
+        for assoc_id, assoc_candidates in candidates.items():
+            assignment = hint.assignments.get(assoc_id)
+            hint_lunch_start = (
+                assignment.lunch_block.start_slot
+                if assignment is not None and assignment.lunch_block is not None
+                else None
+            )
+            matched = False
+            for c_idx, candidate in enumerate(assoc_candidates):
+                chosen = (
+                    not matched
+                    and assignment is not None
+                    and candidate.start_slot == assignment.shift_start_slot
+                    and candidate.end_slot == assignment.shift_end_slot
+                )
+                matched = matched or chosen
+                model.AddHint(x[assoc_id][c_idx], chosen)
+
+                lunch_positions = lunch_vars[assoc_id].get(c_idx)
+                if lunch_positions:
+                    lunch_start = hint_lunch_start if chosen else None
+                    for start, lunch_var in lunch_positions.items():
+                        model.AddHint(lunch_var, start == lunch_start)
+
     def _extract_solution(
         self,
         solver: cp_model.CpSolver,
@@ -75,6 +75,13 @@ class DemandAwareConfig:
         default_weekend_profile: Profile for weekends if auto-generating.
         balance_across_days: Whether to balance demand matching across days.
         track_demand_metrics: Whether to calculate demand metrics.
+        hint_previous_day: If True, the CP-SAT solver is warm-started from
+            the previous day's schedule. Off by default since a stale hint
+            can slow the search; hybrid mode hints from the same day's
+            heuristic schedule instead.
+        hint_heuristic: If True, hybrid mode runs the heuristic before CP-SAT
+            and warm-starts the search from its schedule. If False, the
+            heuristic only runs when CP-SAT finds no solution.
     """
 
     solver_type: SolverType = SolverType.HYBRID
@@ -85,12 +92,17 @@ class DemandAwareConfig:
     default_weekend_profile: Optional[DemandProfile] = None
     balance_across_days: bool = True
     track_demand_metrics: bool = True
+    hint_previous_day: bool = False
+    hint_heuristic: bool = True
 
 
 @dataclass
 class DemandAwareWeeklyResult:
     """Result from demand-aware weekly scheduling.
 
+    The per-day dicts, like schedule.day_schedules, are filled in date
+    order, so iterating them needs no sorting.
+
     Attributes:
         schedule: The generated WeeklySchedule.
         demand_metrics: Dict of date to DemandMetrics.
@@ -205,6 +217,7 @@ class DemandAwareWeeklyScheduler:
         solver_stats: dict[date, dict] = {}
 
         all_dates = request.schedule_dates
+        previous_schedule: Optional[DaySchedule] = None
 
         # Schedule each day
         for i, schedule_date in enumerate(all_dates):
@@ -270,7 +283,9 @@ class DemandAwareWeeklyScheduler:
                 candidates,
                 associates_map,
                 day_demand,
+                previous_schedule,
             )
+            previous_schedule = day_schedule
 
             solver_stats[schedule_date] = stats
 
@@ -324,30 +339,10 @@ class DemandAwareWeeklyScheduler:
         num_associates = len(request.associates)
         scale_factor = max(0.5, min(2.0, num_associates / 10.0))
 
-        # Create scaled profiles
-        scaled_weekday = DemandProfile(
-            name=weekday_profile.name,
-            description=weekday_profile.description,
-            hourly_pattern={
-                h: max(1, int(v * scale_factor))
-                for h, v in weekday_profile.hourly_pattern.items()
-            },
-            priority_windows=weekday_profile.priority_windows,
-        )
-        scaled_weekend = DemandProfile(
-            name=weekend_profile.name,
-            description=weekend_profile.description,
-            hourly_pattern={
-                h: max(1, int(v * scale_factor))
-                for h, v in weekend_profile.hourly_pattern.items()
-            },
-            priority_windows=weekend_profile.priority_windows,
-        )
-
         return WeeklyDemand.create_standard_week(
             request.start_date,
-            weekday_profile=scaled_weekday,
-            weekend_profile=scaled_weekend,
+            weekday_profile=weekday_profile.scaled(scale_factor),
+            weekend_profile=weekend_profile.scaled(scale_factor),
         )
 
     def _solve_day(
@@ -356,6 +351,7 @@ class DemandAwareWeeklyScheduler:
         candidates: dict[str, list],
         associates_map: dict[str, Associate],
         demand_curve: Optional[DemandCurve],
+        previous_schedule: Optional[DaySchedule] = None,
     ) -> tuple[DaySchedule, dict]:
         """Solve a single day using the configured solver."""
         stats: dict = {"solver_type": self.config.solver_type.value}
@@ -365,8 +361,11 @@ class DemandAwareWeeklyScheduler:
             stats["method"] = "heuristic"
 
         elif self.config.solver_type == SolverType.CPSAT:
+            # Consecutive days share associates and shift shapes, so the
+            # previous day's assignments are usually a good starting point
+            hint = previous_schedule if self.config.hint_previous_day else None
             result = self.cpsat_solver.solve(
-                request, candidates, associates_map, demand_curve
+                request, candidates, associates_map, demand_curve, hint=hint
             )
             stats.update({
                 "method": "cpsat",
@@ -385,8 +384,19 @@ class DemandAwareWeeklyScheduler:
                 stats["fallback"] = True
 
         else:  # HYBRID
+            # When hinting, the heuristic schedule warm-starts CP-SAT and is
+            # reused as the fallback; otherwise it only runs on fallback
+            heuristic_schedule = None
+            if self.config.hint_heuristic:
+                heuristic_schedule = self.heuristic_solver.solve(
+                    request, candidates, associates_map
+                )
             result = self.cpsat_solver.solve(
-                request, candidates, associates_map, demand_curve
+                request,
+                candidates,
+                associates_map,
+                demand_curve,
+                hint=heuristic_schedule,
             )
             stats.update({
                 "method": "hybrid",
@@ -398,9 +408,11 @@ class DemandAwareWeeklyScheduler:
                 schedule = result.schedule
                 stats["used"] = "cpsat"
             else:
-                schedule = self.heuristic_solver.solve(
-                    request, candidates, associates_map
-                )
+                if heuristic_schedule is None:
+                    heuristic_schedule = self.heuristic_solver.solve(
+                        request, candidates, associates_map
+                    )
+                schedule = heuristic_schedule
                 stats["used"] = "heuristic"
 
         return schedule, stats
@@ -507,13 +519,14 @@ class DemandAwareWeeklyScheduler:
         """Generate candidates with fairness-aware ordering."""
         candidates = self.candidate_generator.generate_all_candidates(request, step_slots)
 
+        all_minutes = [s.minutes_scheduled for s in weekly_states.values()]
+        avg_minutes = sum(all_minutes) / len(all_minutes) if all_minutes else 0
+
         for assoc_id, assoc_candidates in candidates.items():
             if assoc_id not in weekly_states:
                 continue
 
             state = weekly_states[assoc_id]
-            all_minutes = [s.minutes_scheduled for s in weekly_states.values()]
-            avg_minutes = sum(all_minutes) / len(all_minutes) if all_minutes else 0
 
             if state.minutes_scheduled < avg_minutes:
                 assoc_candidates.sort(key=lambda c: -c.work_minutes)
@@ -8,6 +8,7 @@ This module implements a greedy heuristic approach to:
 """
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 
 from ogphelper.domain.models import (
@@ -32,6 +33,33 @@ from ogphelper.domain.policies import (
 )
 from ogphelper.scheduling.candidate_generator import CandidateGenerator, ShiftCandidate
 
+# Score for covering a slot, indexed by its current on-floor count; low
+# coverage earns a bonus, and slots with 5 or more associates score 1.0
+_COVERAGE_SCORES: tuple[float, ...] = (10.0, 5.0, 5.0, 2.0, 2.0)
+
+
+# Constrained roles in the order they are staffed before overflowing to Picking
+_CONSTRAINED_ROLE_PRIORITY: tuple[JobRole, ...] = (
+    JobRole.GMD_SM,
+    JobRole.EXCEPTION_SM,
+    JobRole.STAGING,
+    JobRole.BACKROOM,
+    JobRole.SR,
+)
+
+
+# Position of each role in SlotState.role_counts
+_ROLE_INDEX: MappingProxyType[JobRole, int] = MappingProxyType(
+    {role: i for i, role in enumerate(JobRole)}
+)
+
+
+def _coverage_score(on_floor_count: int) -> float:
+    """Get the score for adding one associate to a slot."""
+    if on_floor_count < len(_COVERAGE_SCORES):
+        return _COVERAGE_SCORES[on_floor_count]
+    return 1.0
+
 
 @dataclass
 class SlotState:
@@ -40,9 +68,8 @@ class SlotState:
     on_floor_count: int = 0
     on_lunch_count: int = 0
     on_break_count: int = 0
-    role_counts: dict[JobRole, int] = field(
-        default_factory=lambda: {role: 0 for role in JobRole}
-    )
+    # Associates assigned to each role, indexed by _ROLE_INDEX
+    role_counts: list[int] = field(default_factory=lambda: [0] * len(JobRole))
 
     @property
     def total_scheduled(self) -> int:
@@ -222,6 +249,10 @@ class HeuristicSolver:
             for cfg in shift_start_configs:
                 start_config_by_slot[cfg.start_slot] = cfg
 
+        # Per-slot coverage scores, updated as shifts are selected so each
+        # candidate is scored with one sum over its slots
+        slot_scores = [_coverage_score(s.on_floor_count) for s in slot_states]
+
         # Sort associates by number of candidates (fewer first - more constrained)
         sorted_associates = sorted(candidates.keys(), key=lambda a: len(candidates[a]))
 
@@ -253,7 +284,7 @@ class HeuristicSolver:
                             # This start time is at capacity, skip this candidate
                             continue
 
-                score = self._score_shift(candidate, slot_states)
+                score = self._score_shift(candidate, slot_scores)
 
                 # Add bonus/penalty based on shift block targets
                 if shift_block_configs and block_state:
@@ -281,7 +312,9 @@ class HeuristicSolver:
                 selected.append(best_candidate)
                 # Update slot states (initially all on floor)
                 for slot in range(best_candidate.start_slot, best_candidate.end_slot):
-                    slot_states[slot].on_floor_count += 1
+                    state = slot_states[slot]
+                    state.on_floor_count += 1
+                    slot_scores[slot] = _coverage_score(state.on_floor_count)
 
                 # Update shift block state
                 if shift_block_configs and block_state:
@@ -298,27 +331,21 @@ class HeuristicSolver:
     def _score_shift(
         self,
         candidate: ShiftCandidate,
-        slot_states: list[SlotState],
+        slot_scores: list[float],
     ) -> float:
         """Score a shift candidate based on coverage contribution.
 
         Higher scores are better. Shifts that cover low-coverage slots
         get bonus points.
-        """
-        score = 0.0
 
-        for slot in range(candidate.start_slot, candidate.end_slot):
-            current_coverage = slot_states[slot].on_floor_count
+        Args:
+            candidate: The shift candidate to score.
+            slot_scores: Current per-slot coverage scores (see _coverage_score).
 
-            # Bonus for low-coverage slots (diminishing returns for high coverage)
-            if current_coverage == 0:
-                score += 10.0  # High value for uncovered slots
-            elif current_coverage < 3:
-                score += 5.0
-            elif current_coverage < 5:
-                score += 2.0
-            else:
-                score += 1.0
+        Returns:
+            Sum of the covered slots' scores plus a small shift length bonus.
+        """
+        score = sum(slot_scores[candidate.start_slot:candidate.end_slot])
 
         # Slight preference for longer shifts (more flexibility for lunch/breaks)
         score += candidate.work_minutes / 100.0
@@ -582,8 +609,9 @@ class HeuristicSolver:
             if role:
                 assignments.append(JobAssignment(role=role, block=period))
                 # Update slot states
+                role_index = _ROLE_INDEX[role]
                 for slot in range(period.start_slot, period.end_slot):
-                    slot_states[slot].role_counts[role] += 1
+                    slot_states[slot].role_counts[role_index] += 1
 
                 # Track initial role for 5AM starters
                 if is_5am_starter and initial_role is None:
@@ -645,6 +673,30 @@ class HeuristicSolver:
                     return caps.get_cap(role)
         return job_caps.get(role, 999)
 
+    def _role_has_capacity(
+        self,
+        role: JobRole,
+        period: ScheduleBlock,
+        slot_states: list[SlotState],
+        job_caps: dict[JobRole, int],
+        slot_range_caps: Optional[list[SlotRangeCaps]] = None,
+    ) -> bool:
+        """Check that a role is under its cap in every slot of a period."""
+        role_index = _ROLE_INDEX[role]
+        if not slot_range_caps:
+            # Without slot-specific caps the cap is the same for every slot
+            cap = job_caps.get(role, 999)
+            return all(
+                slot_states[slot].role_counts[role_index] < cap
+                for slot in range(period.start_slot, period.end_slot)
+            )
+
+        for slot in range(period.start_slot, period.end_slot):
+            cap = self._get_cap_for_slot(slot, role, job_caps, slot_range_caps)
+            if slot_states[slot].role_counts[role_index] >= cap:
+                return False
+        return True
+
     def _try_preserve_role(
         self,
         role: JobRole,
@@ -664,10 +716,10 @@ class HeuristicSolver:
             return None
 
         # Check if we can assign this role (under cap for all slots)
-        for slot in range(period.start_slot, period.end_slot):
-            cap = self._get_cap_for_slot(slot, role, job_caps, slot_range_caps)
-            if slot_states[slot].role_counts[role] >= cap:
-                return None
+        if not self._role_has_capacity(
+            role, period, slot_states, job_caps, slot_range_caps
+        ):
+            return None
 
         return role
 
@@ -690,29 +742,15 @@ class HeuristicSolver:
 
         Uses slot-specific caps when available (e.g., 5AM has different staffing).
         """
-        # Priority order for constrained roles
-        constrained_priority = [
-            JobRole.GMD_SM,
-            JobRole.EXCEPTION_SM,
-            JobRole.STAGING,
-            JobRole.BACKROOM,
-            JobRole.SR,
-        ]
-
         # Check if any constrained role needs staffing
-        for role in constrained_priority:
+        for role in _CONSTRAINED_ROLE_PRIORITY:
             if role not in eligible_roles:
                 continue
 
             # Check if we can assign this role (under cap for all slots)
-            can_assign = True
-            for slot in range(period.start_slot, period.end_slot):
-                cap = self._get_cap_for_slot(slot, role, job_caps, slot_range_caps)
-                if slot_states[slot].role_counts[role] >= cap:
-                    can_assign = False
-                    break
-
-            if can_assign:
+            if self._role_has_capacity(
+                role, period, slot_states, job_caps, slot_range_caps
+            ):
                 # Check preference - don't force avoid roles for constrained
                 pref = associate.get_preference(role)
                 if pref != Preference.AVOID:
@@ -724,13 +762,9 @@ class HeuristicSolver:
 
         # Last resort: any eligible role
         for role in eligible_roles:
-            can_assign = True
-            for slot in range(period.start_slot, period.end_slot):
-                cap = self._get_cap_for_slot(slot, role, job_caps, slot_range_caps)
-                if slot_states[slot].role_counts[role] >= cap:
-                    can_assign = False
-                    break
-            if can_assign:
+            if self._role_has_capacity(
+                role, period, slot_states, job_caps, slot_range_caps
+            ):
                 return role
 
         return None
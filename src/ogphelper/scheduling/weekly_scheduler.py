@@ -630,6 +630,10 @@ class WeeklyScheduler:
             request, step_slots
         )
 
+        # Average hours so far; the same for every associate on this day
+        all_minutes = [s.minutes_scheduled for s in weekly_states.values()]
+        avg_minutes = sum(all_minutes) / len(all_minutes) if all_minutes else 0
+
         # Sort candidates for each associate by fairness-adjusted preference
         # (shorter shifts for those ahead on hours, longer for those behind)
         for assoc_id, assoc_candidates in candidates.items():
@@ -637,8 +641,6 @@ class WeeklyScheduler:
                 continue
 
             state = weekly_states[assoc_id]
-            all_minutes = [s.minutes_scheduled for s in weekly_states.values()]
-            avg_minutes = sum(all_minutes) / len(all_minutes) if all_minutes else 0
 
             # Sort candidates: if behind on hours, prefer longer shifts
             if state.minutes_scheduled < avg_minutes:
@@ -699,7 +701,8 @@ class WeeklyScheduler:
             step_slots: Candidate generation granularity.
 
         Returns:
-            Tuple of (schedule, stats_dict).
+            Tuple of (schedule, stats_dict). schedule.day_schedules and the
+            per-day stats (e.g. "coverage_by_day") are in date order.
         """
         schedule = self.generate_schedule(request, step_slots)
 
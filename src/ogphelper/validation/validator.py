@@ -412,9 +412,10 @@ class ScheduleValidator:
         result: ValidationResult,
     ) -> None:
         """Validate that role caps are not exceeded at any slot."""
+        role_coverage = schedule.get_role_coverage_timeline()
         for slot in range(schedule.total_slots):
             for role in JobRole:
-                count = schedule.get_role_coverage_at_slot(slot, role)
+                count = role_coverage[role][slot]
                 cap = request.job_caps.get(role, 999)
 
                 if count > cap:
@@ -437,10 +438,10 @@ class ScheduleValidator:
     ) -> None:
         """Check that job assignments cover all work slots."""
         # Get all work slots (on-floor slots)
-        for slot in range(assignment.shift_start_slot, assignment.shift_end_slot):
-            if assignment.is_on_floor(slot):
-                role = assignment.get_role_at_slot(slot)
-                if role is None:
+        roles = assignment.get_roles_by_slot()
+        for start, end in assignment.get_on_floor_intervals():
+            for slot in range(start, end):
+                if slot not in roles:
                     result.add_error(
                         ValidationError(
                             error_type=ValidationErrorType.NO_JOB_ASSIGNMENT,
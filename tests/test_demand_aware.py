@@ -43,6 +43,7 @@ from ogphelper.scheduling.demand_aware_scheduler import (
     SolverType,
     create_demand_aware_scheduler,
 )
+from ogphelper.scheduling.heuristic_solver import HeuristicSolver
 
 
 # ============================================================================
@@ -154,6 +155,17 @@ class TestDemandCurve:
         assert point.target_staff == 5
         assert point.max_staff == 8
 
+    def test_unset_slot_uses_default_demand(self, sample_date: date) -> None:
+        """Test that slots without demand get the default demand point."""
+        curve = DemandCurve(schedule_date=sample_date)
+
+        point = curve.get_demand_at_slot(7)
+        assert point.slot == 7
+        assert point.min_staff == 0
+        assert point.target_staff == 1
+        assert point.max_staff == 99
+        assert point.priority == DemandPriority.NORMAL
+
     def test_set_demand_range(self, sample_date: date) -> None:
         """Test setting demand for a range of slots."""
         curve = DemandCurve(schedule_date=sample_date)
@@ -170,6 +182,21 @@ class TestDemandCurve:
             assert point.target_staff == 6
             assert curve.get_priority_at_slot(slot) == DemandPriority.HIGH
 
+    def test_priority_timeline_matches_slot_lookup(self, sample_date: date) -> None:
+        """Test that the priority timeline agrees with per-slot lookups."""
+        curve = DemandCurve(schedule_date=sample_date)
+        curve.set_demand_range(10, 30, priority=DemandPriority.LOW)
+        curve.add_priority_period(5, 15, DemandPriority.CRITICAL)
+        curve.add_priority_period(12, 40, DemandPriority.HIGH)
+
+        timeline = curve.get_priority_timeline()
+        assert len(timeline) == curve.total_slots
+        assert timeline == [
+            curve.get_priority_at_slot(slot) for slot in range(curve.total_slots)
+        ]
+        # Earlier periods take precedence where they overlap
+        assert timeline[12] == DemandPriority.CRITICAL
+
     def test_from_hourly_pattern(self, sample_date: date) -> None:
         """Test creating curve from hourly pattern."""
         hourly = {
@@ -228,6 +255,34 @@ class TestDemandProfile:
         weekday = DemandProfile.create_weekday_profile()
         assert profile.hourly_pattern.get(10, 0) > weekday.hourly_pattern.get(10, 0)
 
+    def test_scaled(self) -> None:
+        """Test scaling a profile's staffing targets."""
+        profile = DemandProfile.create_weekday_profile()
+        scaled = profile.scaled(0.5)
+
+        assert scaled.name == profile.name
+        assert scaled.priority_windows == profile.priority_windows
+        assert scaled.hourly_pattern[10] == 5
+        assert scaled.hourly_pattern[21] == 1  # 3 * 0.5 truncates to 1
+        assert profile.scaled(0.1).hourly_pattern[5] == 1  # Never below 1
+        assert profile.hourly_pattern[10] == 10  # Original unchanged
+
+    def test_scaled_role_patterns_keep_zero_targets(self) -> None:
+        """Test that scaling leaves zero role targets at zero."""
+        profile = DemandProfile(
+            name="roles",
+            hourly_pattern={10: 6},
+            role_patterns={JobRole.PICKING: {9: 0, 10: 4, 11: 1}},
+        )
+        scaled = profile.scaled(0.1)
+
+        assert scaled.role_patterns[JobRole.PICKING] == {9: 0, 10: 1, 11: 1}
+        assert profile.scaled(2.0).role_patterns[JobRole.PICKING] == {
+            9: 0,
+            10: 8,
+            11: 2,
+        }
+
     def test_to_demand_curve(self, sample_date: date) -> None:
         """Test converting profile to curve."""
         profile = DemandProfile.create_weekday_profile()
@@ -305,6 +360,20 @@ class TestWeeklyDemand:
         saturday_curve = weekly.get_demand_for_date(saturday)
         assert saturday_curve is not None
 
+    def test_standard_week_curves_are_independent(self, sample_date: date) -> None:
+        """Test that each day gets its own curve matching its profile."""
+        weekly = WeeklyDemand.create_standard_week(sample_date)
+        weekday = DemandProfile.create_weekday_profile()
+
+        tuesday = sample_date + timedelta(days=1)
+        tuesday_curve = weekly.get_demand_for_date(tuesday)
+        assert tuesday_curve.schedule_date == tuesday
+        assert tuesday_curve == weekday.to_demand_curve(tuesday)
+
+        monday_curve = weekly.get_demand_for_date(sample_date)
+        monday_curve.set_demand(20, target_staff=50)
+        assert tuesday_curve.get_target_staff_at_slot(20) != 50
+
     def test_apply_profile(self, sample_date: date) -> None:
         """Test applying a custom profile."""
         weekly = WeeklyDemand()
@@ -381,6 +450,15 @@ class TestSolverConfig:
         assert config.optimization_mode == OptimizationMode.MATCH_DEMAND
         assert config.demand_weight == 80
 
+    def test_search_parameters_default_to_solver(self) -> None:
+        """Test CP-SAT search parameters are left to the solver by default."""
+        config = SolverConfig()
+        assert config.linearization_level is None
+        assert config.probing_level is None
+        assert config.boolean_encoding_level is None
+        assert config.optimize_with_core is None
+        assert config.parameter_overrides == {}
+
 
 class TestCPSATSolver:
     """Tests for CPSATSolver."""
@@ -434,6 +512,84 @@ class TestCPSATSolver:
         assert result.is_feasible
         assert result.schedule is not None
 
+    def test_solve_with_hint(
+        self, sample_date: date, sample_associates: list[Associate]
+    ) -> None:
+        """Test warm-starting the solver from a heuristic schedule."""
+        # Two associates never exceed a role cap, so the hint is feasible
+        associates = sample_associates[:2]
+        request = ScheduleRequest(
+            schedule_date=sample_date,
+            associates=associates,
+        )
+
+        demand_curve = DemandCurve.create_default(
+            sample_date,
+            base_demand=2,
+            peak_demand=4,
+        )
+
+        generator = CandidateGenerator()
+        candidates = generator.generate_all_candidates(request, step_slots=8)
+        associates_map = {a.id: a for a in associates}
+        hint = HeuristicSolver().solve(request, candidates, associates_map)
+
+        config = SolverConfig(
+            optimization_mode=OptimizationMode.MATCH_DEMAND,
+            time_limit_seconds=10.0,
+        )
+        solver = CPSATSolver(config=config)
+        result = solver.solve(
+            request, candidates, associates_map, demand_curve, hint=hint
+        )
+
+        assert result.is_feasible
+        assert result.schedule is not None
+        assert len(result.schedule.assignments) == len(associates)
+
+    def test_solve_with_search_parameters(
+        self, sample_date: date, sample_associates: list[Associate]
+    ) -> None:
+        """Test solving with tuned CP-SAT search parameters."""
+        request = ScheduleRequest(
+            schedule_date=sample_date,
+            associates=sample_associates,
+        )
+
+        generator = CandidateGenerator()
+        candidates = generator.generate_all_candidates(request, step_slots=8)
+        associates_map = {a.id: a for a in sample_associates}
+
+        config = SolverConfig(
+            time_limit_seconds=10.0,
+            linearization_level=0,
+            probing_level=0,
+            parameter_overrides={"search_branching": "AUTOMATIC_SEARCH"},
+        )
+        solver = CPSATSolver(config=config)
+        result = solver.solve(request, candidates, associates_map)
+
+        assert result.is_feasible
+        assert result.schedule is not None
+
+    def test_invalid_parameter_overrides(
+        self, sample_date: date, sample_associates: list[Associate]
+    ) -> None:
+        """Test unknown CP-SAT parameter overrides are rejected."""
+        request = ScheduleRequest(
+            schedule_date=sample_date,
+            associates=sample_associates[:2],
+        )
+
+        generator = CandidateGenerator()
+        candidates = generator.generate_all_candidates(request, step_slots=8)
+        associates_map = {a.id: a for a in sample_associates}
+
+        config = SolverConfig(parameter_overrides={"not_a_parameter": 1})
+        solver = CPSATSolver(config=config)
+        with pytest.raises(ValueError):
+            solver.solve(request, candidates, associates_map)
+
     def test_solver_result_properties(self) -> None:
         """Test SolverResult properties."""
         result = SolverResult(
@@ -500,6 +656,8 @@ class TestDemandAwareConfig:
         assert config.solver_type == SolverType.HYBRID
         assert config.auto_generate_demand is True
         assert config.track_demand_metrics is True
+        assert config.hint_previous_day is False
+        assert config.hint_heuristic is True
 
     def test_custom_config(self) -> None:
         """Test custom configuration."""
@@ -564,6 +722,25 @@ class TestDemandAwareWeeklyScheduler:
         # Metrics calculated for days with shifts (may be less than 7 if associates run out of hours)
         assert len(result.demand_metrics) >= 5
 
+    def test_results_in_date_order(
+        self, sample_date: date, weekly_associates: list[Associate]
+    ) -> None:
+        """Test that per-day results iterate in date order without sorting."""
+        request = WeeklyScheduleRequest(
+            start_date=sample_date,
+            end_date=sample_date + timedelta(days=6),
+            associates=weekly_associates,
+            days_off_pattern=DaysOffPattern.TWO_CONSECUTIVE,
+        )
+
+        config = DemandAwareConfig(solver_type=SolverType.HEURISTIC)
+        scheduler = DemandAwareWeeklyScheduler(config=config)
+        result = scheduler.generate_schedule(request)
+
+        assert list(result.schedule.day_schedules) == request.schedule_dates
+        assert list(result.demand_metrics) == sorted(result.demand_metrics)
+        assert list(result.solver_stats) == sorted(result.solver_stats)
+
     def test_hybrid_solver_fallback(
         self, sample_date: date, weekly_associates: list[Associate]
     ) -> None:
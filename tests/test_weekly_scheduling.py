@@ -98,6 +98,17 @@ class TestWeeklyScheduleModels:
         assert request.is_busy_day(base_date + timedelta(days=5))
         assert not request.is_busy_day(base_date)
 
+    def test_availability_is_immutable(self):
+        """Test that Availability can be safely shared between associates."""
+        avail = Availability(start_slot=0, end_slot=68)
+
+        with pytest.raises(AttributeError):
+            avail.end_slot = 40
+
+        assert avail == Availability(start_slot=0, end_slot=68)
+        assert hash(avail) == hash(Availability(start_slot=0, end_slot=68))
+        assert Availability.off_day().is_off
+
     def test_fairness_metrics_calculation(self):
         """Test fairness metrics are calculated correctly."""
         weekly_minutes = {"A001": 2400, "A002": 2400, "A003": 2400}
@@ -176,6 +187,82 @@ class TestWeeklyScheduleModels:
         assert len(days_off) == 2
         assert base_date + timedelta(days=5) in days_off  # Saturday
         assert base_date + timedelta(days=6) in days_off  # Sunday
+        assert days_off == sorted(days_off)
+
+    def test_coverage_timeline_excludes_lunch_and_breaks(self, base_date):
+        """Test coverage timeline counts only on-floor slots."""
+        from ogphelper.domain.models import DaySchedule, ScheduleBlock, ShiftAssignment
+
+        day_schedule = DaySchedule(schedule_date=base_date)
+        day_schedule.assignments["A001"] = ShiftAssignment(
+            associate_id="A001",
+            schedule_date=base_date,
+            shift_start_slot=0,
+            shift_end_slot=36,
+            lunch_block=ScheduleBlock(16, 20),
+            break_blocks=[ScheduleBlock(8, 9), ScheduleBlock(28, 29)],
+        )
+        day_schedule.assignments["A002"] = ShiftAssignment(
+            associate_id="A002",
+            schedule_date=base_date,
+            shift_start_slot=30,
+            shift_end_slot=68,
+        )
+
+        assert day_schedule.assignments["A001"].get_on_floor_intervals() == [
+            (0, 8), (9, 16), (20, 28), (29, 36),
+        ]
+
+        timeline = day_schedule.get_coverage_timeline()
+        assert len(timeline) == day_schedule.total_slots
+        assert timeline == [
+            day_schedule.get_coverage_at_slot(slot)
+            for slot in range(day_schedule.total_slots)
+        ]
+        assert timeline[8] == 0  # A001 on break
+        assert timeline[18] == 0  # A001 at lunch
+        assert timeline[32] == 2  # Both on floor
+
+    def test_role_coverage_timeline_matches_per_slot_counts(self, base_date):
+        """Test role coverage timeline agrees with per-slot role counts."""
+        from ogphelper.domain.models import (
+            DaySchedule,
+            JobAssignment,
+            JobRole,
+            ScheduleBlock,
+            ShiftAssignment,
+        )
+
+        day_schedule = DaySchedule(schedule_date=base_date)
+        day_schedule.assignments["A001"] = ShiftAssignment(
+            associate_id="A001",
+            schedule_date=base_date,
+            shift_start_slot=0,
+            shift_end_slot=20,
+            lunch_block=ScheduleBlock(8, 12),
+            job_assignments=[
+                JobAssignment(JobRole.PICKING, ScheduleBlock(0, 10)),
+                JobAssignment(JobRole.STAGING, ScheduleBlock(6, 20)),
+            ],
+        )
+        day_schedule.assignments["A002"] = ShiftAssignment(
+            associate_id="A002",
+            schedule_date=base_date,
+            shift_start_slot=4,
+            shift_end_slot=16,
+            job_assignments=[JobAssignment(JobRole.STAGING, ScheduleBlock(4, 14))],
+        )
+
+        timeline = day_schedule.get_role_coverage_timeline()
+        for role in JobRole:
+            assert timeline[role] == [
+                day_schedule.get_role_coverage_at_slot(slot, role)
+                for slot in range(day_schedule.total_slots)
+            ]
+        assert timeline[JobRole.PICKING][7] == 1  # Earlier job block wins
+        assert timeline[JobRole.STAGING][7] == 1
+        assert timeline[JobRole.STAGING][10] == 1  # A001 at lunch
+        assert timeline[JobRole.STAGING][15] == 1  # A002 has no role here
 
 
 class TestDaysOffPatternEnforcer:
@@ -499,6 +586,9 @@ class TestWeeklyScheduler:
         assert "fairness_metrics" in stats
         assert stats["total_associates"] == 5
         assert stats["num_days"] == 7
+        assert list(schedule.day_schedules) == request.schedule_dates
+        coverage_dates = list(stats["coverage_by_day"])
+        assert coverage_dates == sorted(coverage_dates)
 
 
 class TestWeeklyValidation: